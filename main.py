@@ -26,7 +26,12 @@ from fastapi import (
     FastAPI, UploadFile, File, Form, HTTPException, Depends, BackgroundTasks, Request
 )
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse, HTMLResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, FileResponse, HTMLResponse, Response
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - orjson optional, fall back to stdlib json
+    orjson = None  # type: ignore
 from fastapi.staticfiles import StaticFiles
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import uvicorn
@@ -90,12 +95,12 @@ app = FastAPI(
 # Middleware for API request logging
 @app.middleware("http")
 async def ats_system_logging_middleware(request: Request, call_next):
-    start = time.time()
+    start = time.perf_counter()
     method = request.method
     path = request.url.path
     try:
         response = await call_next(request)
-        latency_ms = (time.time() - start) * 1000
+        latency_ms = (time.perf_counter() - start) * 1000
         log_api_event(
             log_type="INFO" if response.status_code < 400 else ("ALERT" if response.status_code < 500 else "ERROR"),
             method=method,
@@ -107,7 +112,7 @@ async def ats_system_logging_middleware(request: Request, call_next):
         )
         return response
     except Exception as e:  # noqa: BLE001
-        latency_ms = (time.time() - start) * 1000
+        latency_ms = (time.perf_counter() - start) * 1000
         log_api_event(
             log_type="ERROR",
             method=method,
@@ -202,6 +207,16 @@ async def user_usage(user: User = Depends(get_current_user)):
     return {"usage": usage, "limits": limits}
 
 # ---------- Resume Analysis (Unified) ----------
+def _analysis_response(payload: dict) -> Response:
+    """Render an analysis payload in one pass.
+
+    orjson serializes ResumeAnalysis dataclasses natively, so the asdict copy and
+    FastAPI's jsonable_encoder walk are both skipped.
+    """
+    if orjson is not None:
+        return Response(content=orjson.dumps(payload), media_type="application/json")
+    return JSONResponse(jsonable_encoder({k: v.to_dict() if isinstance(v, ResumeAnalysis) else v for k, v in payload.items()}))
+
 @app.post("/analyze/file")
 async def analyze_file(
     background_tasks: BackgroundTasks,
@@ -210,7 +225,7 @@ async def analyze_file(
     target_role: Optional[str] = Form(None),
     user: User = Depends(check_rate_limit)
 ):
-    start = time.time()
+    start = time.perf_counter()
     analysis_id = str(uuid.uuid4())
     if resume_processor is None:
         raise HTTPException(status_code=503, detail="Document processing not available in slim runtime. Install full requirements.")
@@ -223,12 +238,12 @@ async def analyze_file(
             processed.cleaned_text, job_description, target_role
         )
         background_tasks.add_task(_store_analysis, user.id, analysis_id, analysis, processed.metadata, file.filename)
-        return {
+        return _analysis_response({
             "analysis_id": analysis_id,
-            "analysis": analysis.to_dict(),
+            "analysis": analysis,
             "file_metadata": processed.metadata.to_dict() if hasattr(processed.metadata, 'to_dict') else {},
-            "processing_time": round(time.time() - start, 3)
-        }
+            "processing_time": round(time.perf_counter() - start, 3)
+        })
     except Exception as e:
         logger.error(f"File analysis failed: {e}")
         raise HTTPException(status_code=500, detail="Analysis failed")
@@ -245,7 +260,7 @@ async def analyze_text(
         raise HTTPException(status_code=503, detail="Text processing not available in slim runtime. Install full requirements.")
     if len(resume_text) < 50:
         raise HTTPException(status_code=400, detail="Resume text too short")
-    start = time.time()
+    start = time.perf_counter()
     analysis_id = str(uuid.uuid4())
     try:
         processed = await resume_processor.process_resume_text(resume_text)
@@ -253,11 +268,11 @@ async def analyze_text(
             processed.cleaned_text, job_description, target_role
         )
         background_tasks.add_task(_store_analysis, user.id, analysis_id, analysis, processed.metadata, "text_input")
-        return {
+        return _analysis_response({
             "analysis_id": analysis_id,
-            "analysis": analysis.to_dict(),
-            "processing_time": round(time.time() - start, 3)
-        }
+            "analysis": analysis,
+            "processing_time": round(time.perf_counter() - start, 3)
+        })
     except Exception:
         raise HTTPException(status_code=500, detail="Analysis failed")
 
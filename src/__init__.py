@@ -19,17 +19,28 @@ __version__ = "1.0.0"
 __author__ = "Idyll Intelligent Systems"
 __email__ = "support@zex-ats-ai.com"
 
-from src.core.config import settings
-from src.core.ats_analyzer import ATSAnalyzer
-try:  # Optional during minimal in-house tests
-    from src.core.resume_processor import ResumeProcessor  # type: ignore
-except Exception:  # pragma: no cover
-    class ResumeProcessor:  # minimal stub
-        def __init__(self, *_, **__):
-            raise RuntimeError("ResumeProcessor dependencies not installed in minimal mode")
-
 __all__ = [
     "settings",
     "ATSAnalyzer", 
     "ResumeProcessor"
 ]
+
+
+def __getattr__(name):
+    # Resolved on first access, so importing any src.* submodule does not build the settings
+    # or pull in the analyzer stack as a side effect.
+    if name == "settings":
+        from src.core.config import get_settings
+        return get_settings()
+    if name == "ATSAnalyzer":
+        from src.core.ats_analyzer import ATSAnalyzer
+        return ATSAnalyzer
+    if name == "ResumeProcessor":
+        try:  # Optional during minimal in-house tests
+            from src.core.resume_processor import ResumeProcessor  # type: ignore
+        except Exception:  # pragma: no cover
+            class ResumeProcessor:  # minimal stub
+                def __init__(self, *_, **__):
+                    raise RuntimeError("ResumeProcessor dependencies not installed in minimal mode")
+        return ResumeProcessor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
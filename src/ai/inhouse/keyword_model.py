@@ -7,6 +7,8 @@ from typing import List, Dict
 import math
 import re
 
+_TOKEN_RE = re.compile(r"[A-Za-z][A-Za-z0-9_+#.-]{1,30}")
+
 class KeywordScorer(BaseModel):
     def __init__(self):
         super().__init__(ModelMetadata(name="keyword_scorer", description="Pure Python TF-IDF like scorer"))
@@ -14,7 +16,7 @@ class KeywordScorer(BaseModel):
         self.num_docs = 0
 
     def _tokenize(self, text: str) -> List[str]:
-        return [t.lower() for t in re.findall(r"[A-Za-z][A-Za-z0-9_+#.-]{1,30}", text)]
+        return [t.lower() for t in _TOKEN_RE.findall(text)]
 
     def add_document(self, text: str):
         tokens = set(self._tokenize(text))
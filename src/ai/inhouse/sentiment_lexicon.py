@@ -8,6 +8,7 @@ import re
 
 POS = {"great","excellent","improved","increased","optimized","successful","achieved","delivered","enhanced","positive","robust","scalable","reliable"}
 NEG = {"issue","problem","failed","delay","error","bug","negative","poor","bottleneck"}
+_WORD_RE = re.compile(r"[A-Za-z']+")
 
 class LexiconSentiment(BaseModel):
     def __init__(self):
@@ -16,7 +17,7 @@ class LexiconSentiment(BaseModel):
     def _predict(self, input_data):
         if not isinstance(input_data,str):
             raise TypeError("LexiconSentiment expects string input")
-        words = [w.lower() for w in re.findall(r"[A-Za-z']+", input_data)]
+        words = [w.lower() for w in _WORD_RE.findall(input_data)]
         total = len(words) or 1
         pos = sum(1 for w in words if w in POS)
         neg = sum(1 for w in words if w in NEG)
@@ -126,29 +126,7 @@ class EnhancedDocumentProcessor:
             temp_path = await self._save_temp_file(file)
             
             try:
-                # Process based on file type
-                processor_method = getattr(
-                    self, 
-                    f"_process_{file_info['format']}", 
-                    self._process_unknown
-                )
-                
-                content_data = await processor_method(temp_path, file_info)
-                
-                # Enhance with AI analysis
-                enhanced_data = await self._enhance_with_ai(content_data, analysis_type)
-                
-                # Generate insights
-                insights = await self._generate_insights(enhanced_data, file_info['format'])
-                
-                return {
-                    "success": True,
-                    "file_info": file_info,
-                    "content": enhanced_data,
-                    "insights": insights,
-                    "processing_time": content_data.get("processing_time", 0)
-                }
-                
+                return await self.process_staged_file(temp_path, file_info, analysis_type)
             finally:
                 # Clean up temporary file
                 if os.path.exists(temp_path):
@@ -162,9 +140,65 @@ class EnhancedDocumentProcessor:
                 "file_info": {"filename": file.filename}
             }
     
-    async def _validate_file(self, file: UploadFile) -> Dict[str, Any]:
-        """Validate file format and extract basic info."""
-        filename = file.filename or "unknown"
+    async def process_staged_file(
+        self,
+        file_path: str,
+        file_info: Dict[str, Any],
+        analysis_type: str = "resume"
+    ) -> Dict[str, Any]:
+        """
+        Process a document that has already been written to disk.
+        
+        The caller owns ``file_path`` and is responsible for removing it.
+        
+        Args:
+            file_path: Path of the staged upload
+            file_info: File metadata as returned by ``describe_file``
+            analysis_type: Type of analysis (resume, job_description, portfolio)
+            
+        Returns:
+            Processed document data with extracted content and analysis
+        """
+        try:
+            # Process based on file type
+            processor_method = getattr(
+                self, 
+                f"_process_{file_info['format']}", 
+                self._process_unknown
+            )
+            
+            content_data = await processor_method(file_path, file_info)
+            
+            # Enhance with AI analysis
+            enhanced_data = await self._enhance_with_ai(content_data, analysis_type)
+            
+            # Generate insights
+            insights = await self._generate_insights(enhanced_data, file_info['format'])
+            
+            return {
+                "success": True,
+                "file_info": file_info,
+                "content": enhanced_data,
+                "insights": insights,
+                "processing_time": content_data.get("processing_time", 0)
+            }
+                    
+        except Exception as e:
+            logger.error(f"Error processing document: {str(e)}")
+            return {
+                "success": False,
+                "error": str(e),
+                "file_info": {"filename": file_info.get("filename")}
+            }
+    
+    def describe_file(
+        self,
+        filename: Optional[str],
+        content_type: Optional[str],
+        size: int
+    ) -> Dict[str, Any]:
+        """Validate file format and build the file info dict without touching the body."""
+        filename = filename or "unknown"
         file_extension = Path(filename).suffix.lower().lstrip('.')
         
         # Check if format is supported
@@ -173,22 +207,26 @@ class EnhancedDocumentProcessor:
         
         # Validate MIME type
         expected_mimes = self.SUPPORTED_FORMATS[file_extension]
-        if file.content_type and file.content_type not in expected_mimes:
-            logger.warning(f"MIME type mismatch: {file.content_type} vs {expected_mimes}")
-        
-        # Get file size
-        file.file.seek(0, 2)  # Seek to end
-        file_size = file.file.tell()
-        file.file.seek(0)  # Reset to beginning
+        if content_type and content_type not in expected_mimes:
+            logger.warning(f"MIME type mismatch: {content_type} vs {expected_mimes}")
         
         return {
             "filename": filename,
             "format": file_extension,
-            "mime_type": file.content_type,
-            "size": file_size,
+            "mime_type": content_type,
+            "size": size,
             "supported": True
         }
     
+    async def _validate_file(self, file: UploadFile) -> Dict[str, Any]:
+        """Validate file format and extract basic info."""
+        # Get file size
+        file.file.seek(0, 2)  # Seek to end
+        file_size = file.file.tell()
+        file.file.seek(0)  # Reset to beginning
+        
+        return self.describe_file(file.filename, file.content_type, file_size)
+    
     async def _save_temp_file(self, file: UploadFile) -> str:
         """Save uploaded file to temporary location."""
         suffix = Path(file.filename or "temp").suffix
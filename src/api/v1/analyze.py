@@ -4,10 +4,19 @@ Supports: PDF, DOCX, LaTeX, Images, PPT, Excel, Audio, Video
 """
 
 import asyncio
-from typing import Dict, List, Optional, Any
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
 import logging
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, BackgroundTasks
 from fastapi.responses import JSONResponse
+try:
+    import orjson  # noqa: F401  (required by ORJSONResponse)
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:  # pragma: no cover - orjson optional, fall back to stdlib json
+    DefaultResponse = JSONResponse
 import mimetypes
 from pathlib import Path
 from src.utils.system_logger import log_function
@@ -25,7 +34,7 @@ from src.schemas.analysis import (
 from src.utils.rate_limiter import RateLimiter
 from src.utils.validators import validate_file_size, validate_file_type
 
-router = APIRouter()
+router = APIRouter(default_response_class=DefaultResponse)
 logger = logging.getLogger(__name__)
 
 # Initialize processors
@@ -33,6 +42,13 @@ analysis_service = AnalysisService()
 document_processor = EnhancedDocumentProcessor()
 rate_limiter = RateLimiter()
 
+# Uploads are spooled to disk in chunks of this size while being hashed
+_STAGE_CHUNK_SIZE = 1024 * 1024
+# Batch results keyed by (content sha256, format, analysis type) so repeated
+# uploads skip processing; format and score both depend on more than the bytes
+_STAGED_RESULT_CACHE: "OrderedDict[Tuple[str, str, str], Dict]" = OrderedDict()
+_STAGED_RESULT_CACHE_MAX = 256
+
 
 @router.get("/supported-formats", response_model=SupportedFormatsResponse)
 @log_function("INFO", "ANALYZE_SUPPORTED_FORMATS_OK")
@@ -113,7 +129,7 @@ async def get_supported_formats():
         
         return SupportedFormatsResponse(
             success=True,
-            total_formats=len([ext for category in format_categories.values() for format_info in category.values() for ext in format_info["extensions"]]),
+            total_formats=sum(len(format_info["extensions"]) for category in format_categories.values() for format_info in category.values()),
             categories=format_categories,
             max_file_size="50MB",
             processing_features=[
@@ -128,7 +144,7 @@ async def get_supported_formats():
         )
         
     except Exception as e:
-        logger.error(f"Error getting supported formats: {e}")
+        logger.error("Error getting supported formats: %s", e)
         raise HTTPException(status_code=500, detail="Failed to retrieve supported formats")
 
 
@@ -195,12 +211,18 @@ async def analyze_resume_multi_format(
                 )
             
             # Process document with enhanced processor
-            logger.info(f"Processing {file_extension.upper()} file: {file.filename} ({file_size} bytes)")
+            logger.info("Processing %s file: %s (%d bytes)", file_extension.upper(), file.filename, file_size)
             
-            processing_result = await document_processor.process_document(
-                file=file,
-                analysis_type=analysis_type
-            )
+            temp_path, _, staged_size = await _stage(file)
+            try:
+                processing_result = await document_processor.process_staged_file(
+                    temp_path,
+                    document_processor.describe_file(file.filename, file.content_type, staged_size),
+                    analysis_type
+                )
+            finally:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
             
             if not processing_result.get("success"):
                 raise HTTPException(
@@ -330,7 +352,7 @@ async def analyze_resume_multi_format(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in multi-format analysis: {str(e)}")
+        logger.error("Error in multi-format analysis: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error during analysis")
 
 
@@ -372,13 +394,36 @@ async def batch_process_documents(
                 detail="Too many concurrent analyses. Please wait."
             )
         
-        # Process files concurrently
-        tasks = []
-        for file in files:
-            task = process_single_file_async(file, analysis_type, current_user)
-            tasks.append(task)
+        # Stage every upload to disk once; processing then works from the path
+        staged = await asyncio.gather(*[_stage(f) for f in files], return_exceptions=True)
+        in_flight: Dict[Tuple[str, str, str], asyncio.Future] = {}
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        async def _process(file: UploadFile, stage) -> Dict:
+            if isinstance(stage, Exception):
+                raise stage
+            path, sha, size = stage
+            try:
+                file_info = document_processor.describe_file(file.filename, file.content_type, size)
+            except Exception as e:
+                return {"filename": file.filename, "success": False, "error": str(e)}
+            # Identical files of the same format within the batch share a single processing run
+            key = (sha, file_info["format"], analysis_type)
+            if key not in in_flight:
+                in_flight[key] = asyncio.ensure_future(
+                    process_single_file_async(file, analysis_type, current_user, path, sha, size, file_info)
+                )
+            result = await in_flight[key]
+            return {**result, "filename": file.filename}
+        
+        try:
+            results = await asyncio.gather(
+                *[_process(file, stage) for file, stage in zip(files, staged)],
+                return_exceptions=True
+            )
+        finally:
+            for stage in staged:
+                if not isinstance(stage, Exception) and os.path.exists(stage[0]):
+                    os.unlink(stage[0])
         
         # Compile results
         successful_analyses = []
@@ -406,7 +451,7 @@ async def batch_process_documents(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in batch processing: {str(e)}")
+        logger.error("Error in batch processing: %s", e)
         raise HTTPException(status_code=500, detail="Batch processing failed")
 
 
@@ -510,22 +555,71 @@ def get_upgrade_suggestions(tier: str, format_type: str) -> List[str]:
     return []
 
 
+async def _stage(file: UploadFile) -> Tuple[str, str, int]:
+    """Spool an upload to a temporary file in a single read.
+    
+    Returns the temp path, the sha256 of the content and its size in bytes.
+    The caller owns the returned path and must remove it.
+    """
+    suffix = Path(file.filename or "temp").suffix
+    temp_fd, temp_path = tempfile.mkstemp(suffix=suffix)
+    digest = hashlib.sha256()
+    size = 0
+    
+    try:
+        with os.fdopen(temp_fd, 'wb') as tmp_file:
+            while True:
+                chunk = await file.read(_STAGE_CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                tmp_file.write(chunk)
+                size += len(chunk)
+        return temp_path, digest.hexdigest(), size
+    except Exception:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
 @log_function("INFO", "ANALYZE_PROCESS_SINGLE_OK")
-async def process_single_file_async(file: UploadFile, analysis_type: str, user: User) -> Dict:
-    """Process a single file asynchronously for batch processing."""
+async def process_single_file_async(
+    file: UploadFile,
+    analysis_type: str,
+    user: User,
+    path: str,
+    sha: str,
+    size: int,
+    file_info: Optional[Dict[str, Any]] = None
+) -> Dict:
+    """Process a single staged file asynchronously for batch processing."""
     try:
-        processing_result = await document_processor.process_document(
-            file=file,
-            analysis_type=analysis_type
+        if file_info is None:
+            file_info = document_processor.describe_file(file.filename, file.content_type, size)
+        key = (sha, file_info["format"], analysis_type)
+        cached = _STAGED_RESULT_CACHE.get(key)
+        if cached is not None:
+            _STAGED_RESULT_CACHE.move_to_end(key)
+            return {**cached, "filename": file.filename}
+        
+        processing_result = await document_processor.process_staged_file(
+            path,
+            file_info,
+            analysis_type
         )
         
-        return {
+        result = {
             "filename": file.filename,
             "success": processing_result.get("success", False),
             "format": processing_result.get("file_info", {}).get("format", "unknown"),
             "text_length": len(processing_result.get("content", {}).get("text", "")),
             "ats_score": processing_result.get("insights", {}).get("ats_score", 0)
         }
+        if result["success"]:
+            _STAGED_RESULT_CACHE[key] = result
+            if len(_STAGED_RESULT_CACHE) > _STAGED_RESULT_CACHE_MAX:
+                _STAGED_RESULT_CACHE.popitem(last=False)
+        return result
     except Exception as e:
         return {
             "filename": file.filename,
@@ -545,6 +639,6 @@ async def perform_advanced_analysis(
     try:
         # This would perform more detailed analysis
         # Save results to database for later retrieval
-        logger.info(f"Advanced analysis completed for {analysis_id}")
+        logger.info("Advanced analysis completed for %s", analysis_id)
     except Exception as e:
-        logger.error(f"Advanced analysis failed for {analysis_id}: {e}")
+        logger.error("Advanced analysis failed for %s: %s", analysis_id, e)
@@ -4,13 +4,153 @@ Secure JWT token management for user authentication.
 """
 
 import jwt
+import base64
+import binascii
+import hashlib
+import heapq
+import hmac
+import json
+import logging
+import math
+import os
+import string
+import threading
+import time
+from calendar import timegm
+from collections import OrderedDict, defaultdict
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List, Set, Tuple
 import secrets
 
 from src.core.config import settings
 from src.utils.system_logger import log_function
 
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC)
+    
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson optional, fall back to stdlib json
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+    
+    _json_loads = json.loads
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    """Base64url-encode without padding, as used in JWT segments."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    """Decode an unpadded base64url JWT segment."""
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+def _urlsafe_token(nbytes: int = 32) -> str:
+    """Random URL-safe identifier; same construction as ``secrets.token_urlsafe``."""
+    return _b64url_encode(os.urandom(nbytes)).decode("ascii")
+
+
+# The HS256 header never changes, so its encoded segment is built once
+_HS256_HEADER_B64 = _b64url_encode(_json_dumps({"alg": "HS256", "typ": "JWT"}))
+
+
+def _token_key(token: Any) -> bytes:
+    """Short digest used to key token caches without retaining raw tokens."""
+    raw = token.encode("utf-8") if isinstance(token, str) else bytes(token)
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+# Characters that satisfy the "special" password requirement
+_SPECIAL_CHARACTERS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+
+# Password character classes, as bit flags
+_UPPER, _LOWER, _DIGIT, _SPECIAL = 1, 2, 4, 8
+_ALL_CLASSES = _UPPER | _LOWER | _DIGIT | _SPECIAL
+
+
+def _build_char_class_table() -> Tuple[int, ...]:
+    table = [0] * 128
+    for chars, flag in (
+        (string.ascii_uppercase, _UPPER),
+        (string.ascii_lowercase, _LOWER),
+        (string.digits, _DIGIT),
+        (_SPECIAL_CHARACTERS, _SPECIAL),
+    ):
+        for c in chars:
+            table[ord(c)] |= flag
+    return tuple(table)
+
+
+# ASCII code point -> class flags
+_CHAR_CLASS = _build_char_class_table()
+
+
+def _scan_password(password: str) -> int:
+    """Return the class flags present in ``password`` in a single pass."""
+    seen = 0
+    for c in password:
+        o = ord(c)
+        if o < 128:
+            seen |= _CHAR_CLASS[o]
+        else:
+            # Non-ASCII letters/digits still count, as with str.isupper() etc.
+            seen |= (_UPPER if c.isupper() else 0) | (_LOWER if c.islower() else 0) | (_DIGIT if c.isdigit() else 0)
+        if seen == _ALL_CLASSES:
+            break
+    return seen
+
+
+# Generated passwords draw from this alphabet; bytes at or above the cutoff
+# are rejected so the modulo mapping stays unbiased.
+_PASSWORD_ALPHABET = (string.ascii_letters + string.digits + "!@#$%^&*").encode("ascii")
+_PASSWORD_CUTOFF = 256 // len(_PASSWORD_ALPHABET) * len(_PASSWORD_ALPHABET)
+
+# Longest token lifetime issued here (API tokens); bounds revocations of tokens without exp
+_MAX_REVOCATION_SECONDS = 365 * 86400
+
+
+class _TTLCache:
+    """Thread-safe LRU mapping whose entries expire after a per-entry deadline."""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[bytes, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: bytes) -> Any:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry[1]
+    
+    def set(self, key: bytes, value: Any, expires_at: Optional[float] = None) -> None:
+        """Cache ``value`` for at most ``ttl`` seconds, never past ``expires_at``."""
+        deadline = time.time() + self.ttl
+        if expires_at is not None:
+            deadline = min(deadline, expires_at)
+        with self._lock:
+            self._data[key] = (deadline, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def pop(self, key: bytes) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
 
 class JWTHandler:
     """JWT token management for authentication."""
@@ -20,6 +160,95 @@ class JWTHandler:
         self.secret_key = settings.jwt_secret_key
         self.algorithm = settings.jwt_algorithm
         self.access_token_expire_minutes = settings.access_token_expire_minutes
+        # Prepare key material once so PyJWT skips per-call key preparation
+        self._signing_key, self._verifying_key = self._prepare_keys(self.secret_key, self.algorithm)
+        # HS256 is signed/verified in-process with a one-shot HMAC; others use PyJWT
+        self._fast_hs256 = self.algorithm == "HS256"
+        # Token lifetimes
+        self._access_delta = timedelta(minutes=self.access_token_expire_minutes)
+        self._refresh_delta = timedelta(days=30)  # 30 days for refresh tokens
+        self._api_delta_seconds = 365 * 86400  # API tokens have longer expiration (1 year)
+        # Recently verified payloads; clients replay the same bearer token per request
+        self._verified_cache = _TTLCache(maxsize=10_000, ttl=30)
+        # Unverified claims, shared by the claim/expiry inspection helpers
+        self._claims_cache = _TTLCache(maxsize=4096, ttl=60)
+    
+    @staticmethod
+    def _prepare_keys(secret_key: str, algorithm: str) -> Tuple[Any, Any]:
+        """
+        Build the (signing, verifying) key pair for the configured algorithm.
+        
+        HMAC algorithms share the encoded secret; asymmetric algorithms expect
+        ``secret_key`` to hold a PEM private key and verify with its public half.
+        """
+        if algorithm.startswith("HS"):
+            key = secret_key.encode("utf-8")
+            return key, key
+        
+        from cryptography.hazmat.primitives.serialization import load_pem_private_key
+        
+        private_key = load_pem_private_key(secret_key.encode("utf-8"), password=None)
+        return private_key, private_key.public_key()
+    
+    def _encode(self, payload: Dict[str, Any]) -> str:
+        """Sign ``payload`` into a compact JWT."""
+        if not self._fast_hs256:
+            return jwt.encode(payload, self._signing_key, algorithm=self.algorithm)
+        
+        for claim in ("exp", "iat", "nbf"):
+            if isinstance(payload.get(claim), datetime):
+                payload[claim] = timegm(payload[claim].utctimetuple())
+        
+        body = _b64url_encode(_json_dumps(payload))
+        signing_input = _HS256_HEADER_B64 + b"." + body
+        signature = _b64url_encode(hmac.digest(self._signing_key, signing_input, "sha256"))
+        return (signing_input + b"." + signature).decode("ascii")
+    
+    def _decode(self, token: str) -> Dict[str, Any]:
+        """Verify a compact JWT and return its payload, mirroring ``jwt.decode``."""
+        if not self._fast_hs256:
+            return jwt.decode(token, self._verifying_key, algorithms=[self.algorithm])
+        
+        try:
+            raw = token.encode("ascii") if isinstance(token, str) else token
+        except UnicodeEncodeError as e:
+            raise jwt.DecodeError("Invalid token encoding") from e
+        if raw.count(b".") != 2:
+            raise jwt.DecodeError("Not enough segments")
+        
+        signing_input, _, signature_seg = raw.rpartition(b".")
+        header_seg, _, payload_seg = signing_input.partition(b".")
+        try:
+            header = _json_loads(_b64url_decode(header_seg))
+            payload = _json_loads(_b64url_decode(payload_seg))
+            signature = _b64url_decode(signature_seg)
+        except (ValueError, binascii.Error) as e:
+            raise jwt.DecodeError("Invalid token encoding") from e
+        
+        if not isinstance(header, dict) or header.get("alg") != "HS256":
+            raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+        if not hmac.compare_digest(signature, hmac.digest(self._verifying_key, signing_input, "sha256")):
+            raise jwt.InvalidSignatureError("Signature verification failed")
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload string: must be a json object")
+        
+        now = time.time()
+        try:
+            exp = int(payload["exp"]) if "exp" in payload else None
+            nbf = int(payload["nbf"]) if "nbf" in payload else None
+            iat = int(payload["iat"]) if "iat" in payload else None
+        except (TypeError, ValueError) as e:
+            raise jwt.DecodeError("Time claims must be integers") from e
+        if exp is not None and exp <= now:
+            raise jwt.ExpiredSignatureError("Signature has expired")
+        if iat is not None and iat > now:
+            raise jwt.ImmatureSignatureError("The token is not yet valid (iat)")
+        if nbf is not None and nbf > now:
+            raise jwt.ImmatureSignatureError("The token is not yet valid (nbf)")
+        # No audience is configured, so (as with jwt.decode) any audience claim is rejected
+        if payload.get("aud"):
+            raise jwt.InvalidAudienceError("Invalid audience")
+        return payload
     
     @log_function("INFO", "JWT_CREATE_ACCESS_OK")
     def create_access_token(
@@ -37,20 +266,17 @@ class JWTHandler:
         Returns:
             Encoded JWT token
         """
-        to_encode = data.copy()
-        
-        if expires_delta:
-            expire = datetime.utcnow() + expires_delta
-        else:
-            expire = datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes)
+        now = int(time.time())
+        expire = now + int((expires_delta or self._access_delta).total_seconds())
         
-        to_encode.update({
+        to_encode = {
+            **data,
             "exp": expire,
-            "iat": datetime.utcnow(),
+            "iat": now,
             "type": "access"
-        })
+        }
         
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
+        encoded_jwt = self._encode(to_encode)
         return encoded_jwt
     
     @log_function("INFO", "JWT_CREATE_REFRESH_OK")
@@ -64,16 +290,17 @@ class JWTHandler:
         Returns:
             Encoded JWT refresh token
         """
-        to_encode = data.copy()
-        expire = datetime.utcnow() + timedelta(days=30)  # 30 days for refresh tokens
+        now = int(time.time())
+        expire = now + int(self._refresh_delta.total_seconds())
         
-        to_encode.update({
+        to_encode = {
+            **data,
             "exp": expire,
-            "iat": datetime.utcnow(),
+            "iat": now,
             "type": "refresh"
-        })
+        }
         
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
+        encoded_jwt = self._encode(to_encode)
         return encoded_jwt
     
     @log_function("DEBUG", "JWT_VERIFY_OK")
@@ -91,13 +318,24 @@ class JWTHandler:
             jwt.ExpiredSignatureError: Token has expired
             jwt.InvalidTokenError: Token is invalid
         """
+        key = _token_key(token)
+        cached = self._verified_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+        
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            return payload
+            payload = self._decode(token)
         except jwt.ExpiredSignatureError:
             raise jwt.ExpiredSignatureError("Token has expired")
         except jwt.InvalidTokenError:
             raise jwt.InvalidTokenError("Invalid token")
+        
+        self._verified_cache.set(key, payload, float(payload["exp"]) if "exp" in payload else None)
+        return dict(payload)
+    
+    def forget_token(self, token: str) -> None:
+        """Drop a token from the verification cache (e.g. after revocation)."""
+        self._verified_cache.pop(_token_key(token))
     
     @log_function("INFO", "JWT_REFRESH_OK")
     def refresh_access_token(self, refresh_token: str) -> str:
@@ -120,13 +358,15 @@ class JWTHandler:
             if payload.get("type") != "refresh":
                 raise jwt.InvalidTokenError("Not a refresh token")
             
-            # Extract user info and create new access token
-            user_data = {
+            # Build the access token straight from the verified claims
+            now = int(time.time())
+            return self._encode({
                 "sub": payload.get("sub"),
-                "email": payload.get("email")
-            }
-            
-            return self.create_access_token(user_data)
+                "email": payload.get("email"),
+                "exp": now + int(self._access_delta.total_seconds()),
+                "iat": now,
+                "type": "access"
+            })
         
         except jwt.ExpiredSignatureError:
             raise jwt.InvalidTokenError("Refresh token expired")
@@ -144,11 +384,21 @@ class JWTHandler:
         Returns:
             Decoded claims or None if invalid
         """
-        try:
-            # Decode without verification
-            return jwt.decode(token, options={"verify_signature": False})
-        except Exception:
-            return None
+        claims = self._claims(token)
+        return dict(claims) if claims is not None else None
+    
+    def _claims(self, token: str) -> Optional[Dict[str, Any]]:
+        """Cached unverified claims; callers must not mutate the result."""
+        key = _token_key(token)
+        claims = self._claims_cache.get(key)
+        if claims is None:
+            try:
+                # Decode without verification
+                claims = jwt.decode(token, options={"verify_signature": False})
+            except Exception:
+                return None
+            self._claims_cache.set(key, claims)
+        return claims
     
     @log_function("DEBUG", "JWT_EXPIRED_OK")
     def is_token_expired(self, token: str) -> bool:
@@ -161,16 +411,12 @@ class JWTHandler:
         Returns:
             True if expired, False otherwise
         """
+        exp = self._token_exp(token)
+        if exp is None:
+            return True
+        
         try:
-            claims = self.get_token_claims(token)
-            if not claims:
-                return True
-            
-            exp = claims.get("exp")
-            if not exp:
-                return True
-            
-            return datetime.utcnow().timestamp() > exp
+            return time.time() > exp
         except Exception:
             return True
     
@@ -185,19 +431,22 @@ class JWTHandler:
         Returns:
             Expiration datetime or None
         """
+        exp = self._token_exp(token)
+        if exp is None:
+            return None
+        
         try:
-            claims = self.get_token_claims(token)
-            if not claims:
-                return None
-            
-            exp = claims.get("exp")
-            if not exp:
-                return None
-            
             return datetime.fromtimestamp(exp)
         except Exception:
             return None
     
+    def _token_exp(self, token: str) -> Optional[Any]:
+        """Raw ``exp`` claim of a token, or None if absent or undecodable."""
+        claims = self._claims(token)
+        if not claims:
+            return None
+        return claims.get("exp") or None
+    
     @log_function("INFO", "JWT_CREATE_API_OK")
     def create_api_token(self, user_id: str, api_key_id: str) -> str:
         """
@@ -210,15 +459,14 @@ class JWTHandler:
         Returns:
             API JWT token
         """
-        data = {
+        now = int(time.time())
+        return self._encode({
             "sub": user_id,
             "api_key_id": api_key_id,
+            "exp": now + self._api_delta_seconds,
+            "iat": now,
             "type": "api"
-        }
-        
-        # API tokens have longer expiration (1 year)
-        expire_delta = timedelta(days=365)
-        return self.create_access_token(data, expire_delta)
+        })
     
     @log_function("DEBUG", "JWT_VERIFY_API_OK")
     def verify_api_token(self, token: str) -> Dict[str, Any]:
@@ -249,38 +497,183 @@ class JWTHandler:
 
 
 class SessionManager:
-    """Manage user sessions and token blacklisting."""
+    """Manage user sessions and token blacklisting.
     
-    def __init__(self):
+    State lives in process memory until ``initialize()`` connects to Redis;
+    after that sessions and revocations are shared across workers, and any
+    Redis failure falls back to the in-memory store.
+    
+    Redis layout:
+        bl:{digest}             revoked token marker, expires with the token
+        sess:{session_id}       session hash (user_id, token, timestamps)
+        sess:expiry             ZSET of session_id scored by idle deadline
+        user_sessions:{user_id} SET of that user's session ids
+    """
+    
+    SESSION_EXPIRY_KEY = "sess:expiry"
+    
+    def __init__(self, token_handler: Optional[JWTHandler] = None):
         """Initialize session manager."""
-        self.blacklisted_tokens = set()  # In production, use Redis
-        self.active_sessions = {}  # In production, use Redis
+        self.redis_client = None
+        # Revoked tokens are held as digests (digest -> token exp) and pruned
+        # once the revoked token would have expired anyway.
+        self.blacklisted_tokens: Dict[bytes, float] = {}  # Fallback when Redis is unavailable
+        self.active_sessions = {}  # Fallback when Redis is unavailable
+        self.token_handler = token_handler
+        # Sessions expire after 24 hours of inactivity. The heap holds
+        # (deadline, session_id) so cleanup only visits candidates that are due;
+        # entries made stale by newer activity are re-pushed lazily.
+        self._idle_timeout = timedelta(hours=24)
+        self._expiry_heap: List[Tuple[datetime, str]] = []
+        # user_id -> session ids, so per-user invalidation skips other users
+        self._by_user: Dict[str, Set[str]] = defaultdict(set)
+    
+    @log_function("INFO", "SESSION_MANAGER_INIT_OK")
+    def initialize(self) -> None:
+        """Initialize Redis connection."""
+        try:
+            import redis
+            
+            self.redis_client = redis.Redis.from_url(
+                settings.redis_url,
+                decode_responses=True,
+                retry_on_timeout=True
+            )
+            # Test connection
+            self.redis_client.ping()
+        except Exception as e:
+            logger.warning("Redis connection failed, using in-memory sessions: %s", e)
+            self.redis_client = None
+    
+    def _revocation(self, token: str) -> Tuple[bytes, float]:
+        """Digest of ``token`` and the time after which revoking it is moot."""
+        digest = _token_key(token)
+        # Without a readable exp, keep the revocation for the longest lifetime we issue
+        expires_at = time.time() + _MAX_REVOCATION_SECONDS
+        if self.token_handler is not None:
+            self.token_handler.forget_token(token)
+            claims = self.token_handler.get_token_claims(token)
+            if claims and "exp" in claims:
+                expires_at = float(claims["exp"])
+        return digest, expires_at
+    
+    @staticmethod
+    def _queue_blacklist(pipe: Any, digest: bytes, expires_at: float) -> None:
+        """Queue a self-expiring Redis revocation marker."""
+        ttl = expires_at - time.time()
+        if ttl <= 0:
+            return  # Token is already expired; nothing left to block
+        pipe.set(f"bl:{digest.hex()}", 1, ex=max(1, math.ceil(ttl)))
+    
+    def _queue_session_removal(self, pipe: Any, session_id: str, user_id: Optional[str], token: str) -> None:
+        """Queue revocation of a session's token and removal of its Redis keys."""
+        self._queue_blacklist(pipe, *self._revocation(token))
+        pipe.unlink(f"sess:{session_id}")
+        pipe.zrem(self.SESSION_EXPIRY_KEY, session_id)
+        if user_id is not None:
+            pipe.srem(f"user_sessions:{user_id}", session_id)
     
     @log_function("ALERT", "JWT_BLACKLIST_ADD_OK")
     def add_to_blacklist(self, token: str) -> None:
         """Add token to blacklist (logout)."""
-        self.blacklisted_tokens.add(token)
+        digest, expires_at = self._revocation(token)
+        
+        if self.redis_client:
+            try:
+                self._queue_blacklist(self.redis_client, digest, expires_at)
+                return
+            except Exception:
+                # Fallback to local store
+                pass
+        
+        self._blacklist_local(digest, expires_at)
+    
+    def _blacklist_local(self, digest: bytes, expires_at: float) -> None:
+        self.blacklisted_tokens[digest] = expires_at
+    
+    def _unindex_session(self, user_id: str, session_id: str) -> None:
+        user_sessions = self._by_user.get(user_id)
+        if user_sessions is not None:
+            user_sessions.discard(session_id)
+            if not user_sessions:
+                del self._by_user[user_id]
     
     @log_function("DEBUG", "JWT_BLACKLIST_CHECK_OK")
     def is_blacklisted(self, token: str) -> bool:
         """Check if token is blacklisted."""
-        return token in self.blacklisted_tokens
+        digest = _token_key(token)
+        if digest in self.blacklisted_tokens:
+            return True
+        
+        if self.redis_client:
+            try:
+                return bool(self.redis_client.exists(f"bl:{digest.hex()}"))
+            except Exception:
+                pass
+        return False
+    
+    def _prune_blacklist(self, now: float) -> None:
+        """Forget revoked tokens that have expired on their own."""
+        expired = [d for d, exp in self.blacklisted_tokens.items() if exp <= now]
+        for digest in expired:
+            del self.blacklisted_tokens[digest]
     
     @log_function("INFO", "SESSION_CREATE_OK")
     def create_session(self, user_id: str, token: str) -> str:
         """Create a new user session."""
-        session_id = secrets.token_urlsafe(32)
+        session_id = _urlsafe_token(32)
+        now = datetime.utcnow()
+        
+        if self.redis_client:
+            try:
+                pipe = self.redis_client.pipeline(transaction=False)
+                pipe.hset(f"sess:{session_id}", mapping={
+                    "user_id": user_id,
+                    "token": token,
+                    "created_at": now.isoformat(),
+                    "last_activity": now.isoformat()
+                })
+                pipe.zadd(self.SESSION_EXPIRY_KEY, {session_id: time.time() + self._idle_timeout.total_seconds()})
+                pipe.sadd(f"user_sessions:{user_id}", session_id)
+                pipe.execute()
+                return session_id
+            except Exception:
+                # Fallback to local store
+                pass
+        
         self.active_sessions[session_id] = {
             "user_id": user_id,
             "token": token,
-            "created_at": datetime.utcnow(),
-            "last_activity": datetime.utcnow()
+            "created_at": now,
+            "last_activity": now
         }
+        heapq.heappush(self._expiry_heap, (now + self._idle_timeout, session_id))
+        self._by_user[user_id].add(session_id)
         return session_id
     
     @log_function("DEBUG", "SESSION_VALIDATE_OK")
     def validate_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Validate and update session."""
+        if self.redis_client:
+            try:
+                key = f"sess:{session_id}"
+                session = self.redis_client.hgetall(key)
+                if session:
+                    now = datetime.utcnow()
+                    pipe = self.redis_client.pipeline(transaction=False)
+                    pipe.hset(key, "last_activity", now.isoformat())
+                    pipe.zadd(self.SESSION_EXPIRY_KEY, {session_id: time.time() + self._idle_timeout.total_seconds()})
+                    pipe.execute()
+                    return {
+                        "user_id": session["user_id"],
+                        "token": session["token"],
+                        "created_at": datetime.fromisoformat(session["created_at"]),
+                        "last_activity": now
+                    }
+            except Exception:
+                # Fallback to local store
+                pass
+        
         session = self.active_sessions.get(session_id)
         if session:
             # Update last activity
@@ -291,41 +684,150 @@ class SessionManager:
     @log_function("ALERT", "SESSION_INVALIDATE_OK")
     def invalidate_session(self, session_id: str) -> None:
         """Invalidate a specific session."""
+        if self.redis_client:
+            try:
+                user_id, token = self.redis_client.hmget(f"sess:{session_id}", "user_id", "token")
+                if token is not None:
+                    pipe = self.redis_client.pipeline(transaction=False)
+                    self._queue_session_removal(pipe, session_id, user_id, token)
+                    pipe.execute()
+            except Exception:
+                pass
+        
         if session_id in self.active_sessions:
             session = self.active_sessions[session_id]
             # Blacklist associated token
             self.add_to_blacklist(session["token"])
             # Remove session
             del self.active_sessions[session_id]
+            self._unindex_session(session["user_id"], session_id)
     
     @log_function("ALERT", "SESSIONS_INVALIDATE_USER_OK")
     def invalidate_user_sessions(self, user_id: str) -> None:
         """Invalidate all sessions for a user."""
-        sessions_to_remove = []
+        if self.redis_client:
+            try:
+                user_key = f"user_sessions:{user_id}"
+                session_ids = list(self.redis_client.smembers(user_key))
+                if session_ids:
+                    pipe = self.redis_client.pipeline(transaction=False)
+                    for session_id in session_ids:
+                        pipe.hget(f"sess:{session_id}", "token")
+                    tokens = pipe.execute()
+                    
+                    pipe = self.redis_client.pipeline(transaction=False)
+                    for session_id, token in zip(session_ids, tokens):
+                        if token is not None:
+                            self._queue_session_removal(pipe, session_id, None, token)
+                    pipe.unlink(user_key)
+                    pipe.execute()
+            except Exception:
+                pass
         
-        for session_id, session_data in self.active_sessions.items():
-            if session_data["user_id"] == user_id:
+        for session_id in self._by_user.pop(user_id, set()):
+            session_data = self.active_sessions.pop(session_id, None)
+            if session_data is not None:
                 # Blacklist token
                 self.add_to_blacklist(session_data["token"])
-                sessions_to_remove.append(session_id)
-        
-        # Remove sessions
-        for session_id in sessions_to_remove:
-            del self.active_sessions[session_id]
     
     @log_function("ALERT", "SESSIONS_CLEANUP_OK")
     def cleanup_expired_sessions(self) -> None:
         """Remove expired sessions."""
+        if self.redis_client:
+            try:
+                # Deadlines are refreshed on every validation, so the due range is exact
+                due = self.redis_client.zrangebyscore(self.SESSION_EXPIRY_KEY, "-inf", time.time())
+                if due:
+                    pipe = self.redis_client.pipeline(transaction=False)
+                    for session_id in due:
+                        pipe.hmget(f"sess:{session_id}", "user_id", "token")
+                    rows = pipe.execute()
+                    
+                    pipe = self.redis_client.pipeline(transaction=False)
+                    for session_id, (user_id, token) in zip(due, rows):
+                        if token is not None:
+                            self._queue_session_removal(pipe, session_id, user_id, token)
+                        else:
+                            pipe.zrem(self.SESSION_EXPIRY_KEY, session_id)
+                    pipe.execute()
+            except Exception:
+                pass
+        
         current_time = datetime.utcnow()
-        expired_sessions = []
+        heap = self._expiry_heap
+        sessions = self.active_sessions
         
-        for session_id, session_data in self.active_sessions.items():
-            # Sessions expire after 24 hours of inactivity
-            if current_time - session_data["last_activity"] > timedelta(hours=24):
-                expired_sessions.append(session_id)
+        while heap and heap[0][0] < current_time:
+            _, session_id = heapq.heappop(heap)
+            session_data = sessions.get(session_id)
+            if session_data is None:
+                continue  # Already invalidated
+            deadline = session_data["last_activity"] + self._idle_timeout
+            if deadline < current_time:
+                # Blacklist and drop in place rather than re-looking it up
+                self._blacklist_local(*self._revocation(session_data["token"]))
+                del sessions[session_id]
+                self._unindex_session(session_data["user_id"], session_id)
+            else:
+                heapq.heappush(heap, (deadline, session_id))
         
-        for session_id in expired_sessions:
-            self.invalidate_session(session_id)
+        self._prune_blacklist(time.time())
+
+
+def _password_strength(password: str) -> Dict[str, Any]:
+    """Strength analysis shared by the single and batch password checks."""
+    score = 0
+    feedback = []
+    classes = _scan_password(password)
+    requirements = {
+        "length": len(password) >= 8,
+        "uppercase": bool(classes & _UPPER),
+        "lowercase": bool(classes & _LOWER),
+        "digit": bool(classes & _DIGIT),
+        "special": bool(classes & _SPECIAL)
+    }
+
+    # Calculate score
+    for req, met in requirements.items():
+        if met:
+            score += 20
+        else:
+            if req == "length":
+                feedback.append("Password must be at least 8 characters long")
+            elif req == "uppercase":
+                feedback.append("Include at least one uppercase letter")
+            elif req == "lowercase":
+                feedback.append("Include at least one lowercase letter")
+            elif req == "digit":
+                feedback.append("Include at least one number")
+            elif req == "special":
+                feedback.append("Include at least one special character")
+
+    # Bonus points for length
+    if len(password) >= 12:
+        score += 10
+    if len(password) >= 16:
+        score += 10
+
+    # Determine strength level
+    if score >= 90:
+        strength = "Very Strong"
+    elif score >= 70:
+        strength = "Strong"
+    elif score >= 50:
+        strength = "Medium"
+    elif score >= 30:
+        strength = "Weak"
+    else:
+        strength = "Very Weak"
+
+    return {
+        "score": min(score, 100),
+        "strength": strength,
+        "requirements": requirements,
+        "feedback": feedback,
+        "is_acceptable": score >= 70
+    }
 
 
 class PasswordManager:
@@ -335,9 +837,12 @@ class PasswordManager:
     @log_function("DEBUG", "GEN_SECURE_PASSWORD_OK")
     def generate_secure_password(length: int = 16) -> str:
         """Generate a cryptographically secure password."""
-        import string
-        alphabet = string.ascii_letters + string.digits + "!@#$%^&*"
-        return ''.join(secrets.choice(alphabet) for _ in range(length))
+        alphabet = _PASSWORD_ALPHABET
+        size = len(alphabet)
+        password = bytearray()
+        while len(password) < length:
+            password.extend(alphabet[b % size] for b in secrets.token_bytes(length * 2) if b < _PASSWORD_CUTOFF)
+        return password[:length].decode("ascii")
     
     @staticmethod
     @log_function("METRIC", "PASSWORD_STRENGTH_OK")
@@ -351,66 +856,30 @@ class PasswordManager:
         Returns:
             Dictionary with strength analysis
         """
-        score = 0
-        feedback = []
-        requirements = {
-            "length": len(password) >= 8,
-            "uppercase": any(c.isupper() for c in password),
-            "lowercase": any(c.islower() for c in password),
-            "digit": any(c.isdigit() for c in password),
-            "special": any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password)
-        }
+        return _password_strength(password)
+    
+    @staticmethod
+    @log_function("METRIC", "PASSWORD_AUDIT_OK")
+    def audit_passwords(passwords: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Check the strength of many passwords in one call (security audits).
         
-        # Calculate score
-        for req, met in requirements.items():
-            if met:
-                score += 20
-            else:
-                if req == "length":
-                    feedback.append("Password must be at least 8 characters long")
-                elif req == "uppercase":
-                    feedback.append("Include at least one uppercase letter")
-                elif req == "lowercase":
-                    feedback.append("Include at least one lowercase letter")
-                elif req == "digit":
-                    feedback.append("Include at least one number")
-                elif req == "special":
-                    feedback.append("Include at least one special character")
-        
-        # Bonus points for length
-        if len(password) >= 12:
-            score += 10
-        if len(password) >= 16:
-            score += 10
-        
-        # Determine strength level
-        if score >= 90:
-            strength = "Very Strong"
-        elif score >= 70:
-            strength = "Strong"
-        elif score >= 50:
-            strength = "Medium"
-        elif score >= 30:
-            strength = "Weak"
-        else:
-            strength = "Very Weak"
-        
-        return {
-            "score": min(score, 100),
-            "strength": strength,
-            "requirements": requirements,
-            "feedback": feedback,
-            "is_acceptable": score >= 70
-        }
+        Args:
+            passwords: Passwords to analyze
+            
+        Returns:
+            One strength analysis per password, in input order
+        """
+        return [_password_strength(password) for password in passwords]
     
     @staticmethod
     @log_function("DEBUG", "GEN_RESET_TOKEN_OK")
     def generate_reset_token() -> str:
         """Generate secure password reset token."""
-        return secrets.token_urlsafe(32)
+        return _urlsafe_token(32)
 
 
 # Global instances
 jwt_handler = JWTHandler()
-session_manager = SessionManager()
+session_manager = SessionManager(jwt_handler)
 password_manager = PasswordManager()
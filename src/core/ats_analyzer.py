@@ -5,9 +5,16 @@ Advanced AI-powered resume analysis and ATS compatibility scoring.
 
 import re
 import json
+import time
+import copy
 import asyncio
-from typing import Dict, List, Optional, Tuple, Any
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
+from functools import cached_property
+from itertools import islice
 from datetime import datetime
 import logging
 
@@ -17,26 +24,31 @@ try:
 except Exception:
     spacy = None  # type: ignore
 
-try:
-    import nltk  # type: ignore
-except Exception:
-    nltk = None  # type: ignore
-
 try:
     from textstat import flesch_reading_ease  # type: ignore
+    _HAS_TEXTSTAT = True
 except Exception:
+    _HAS_TEXTSTAT = False
+
     def flesch_reading_ease(text: str) -> float:  # fallback
         # Simple heuristic fallback returning mid-range readability
         return 65.0
 
+# Mid-range Flesch value reported when the calculation itself fails
+_NEUTRAL_FLESCH = 65.0
+
 try:
-    from textblob import TextBlob  # type: ignore
+    import numpy as np  # type: ignore
 except Exception:
-    TextBlob = None  # type: ignore
+    np = None  # type: ignore
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
 
 """All external LLM providers removed; file now fully offline."""
 
-from src.core.config import settings
 from src.utils.text_processing import TextProcessor
 from src.utils.keyword_extractor import KeywordExtractor
 from src.utils.sentiment_analyzer import SentimentAnalyzer
@@ -46,10 +58,148 @@ from src.utils.system_logger import log_function
 
 logger = logging.getLogger("zex.ats_analyzer")
 
+# spaCy components never read by the analyzer (entities, dependency arcs)
+_UNUSED_PIPES = ["ner", "parser"]
+
+# Memoized analyses keyed by content hash (LRU bound + TTL)
+_RESULT_CACHE_SIZE = 1024
+_RESULT_CACHE_TTL = 3600.0
+_KEYWORD_CACHE_SIZE = 512
+
+# Precompiled patterns (flags baked in) shared by the scoring helpers
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+# Presence check only: the optional country-code and '(' prefixes of the full phone pattern never decide
+# whether a number is present, and dropping them lets the engine jump straight to digits
+_PHONE_RE = re.compile(r'\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+_ADDR_RE = re.compile(r'\b(street|st\.|avenue|ave\.|road|rd\.|city|state)\b', re.IGNORECASE)
+_NUM_RE = re.compile(r'\d+[%]?|\$\d+')
+_WORD_RE = re.compile(r'[A-Za-z]+')
+_SENT_SPLIT_RE = re.compile(r'[.!?]\s+')
+# Year ranges (2020-2021, 2020 – 2021, 2020/2021) or a month name followed by a year on the same line
+_DATE_RE = re.compile(
+    r'\d{4}\s*[-–/]\s*\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[^\n]{0,20}?\d{4}',
+    re.IGNORECASE,
+)
+_MAX_DATES = 3
+_TECH_SKILL_TERMS = (
+    'python', 'java', 'javascript', 'c++', 'sql', 'html', 'css', 'react', 'node.js', 'aws', 'docker', 'kubernetes',
+    'machine learning', 'data science', 'artificial intelligence', 'deep learning',
+    'agile', 'scrum', 'devops', 'ci/cd', 'git', 'jenkins', 'terraform',
+)
+_SOFT_SKILL_TERMS = ('leadership', 'communication', 'teamwork', 'problem-solving')
+_SKILL_RE = re.compile(r'\b(' + '|'.join(map(re.escape, _TECH_SKILL_TERMS)) + r')\b', re.IGNORECASE)
+# Section-header words looked for in each line (substring semantics: "Experienced" still counts)
+_FORMAT_HEADER_RE = re.compile('summary|experience|education|skills|projects|certifications')
+_PROGRAMMING_SKILLS = frozenset({'python', 'java', 'javascript', 'c++'})
+_CLOUD_SKILLS = frozenset({'aws', 'docker', 'kubernetes'})
+_STRONG_VERB_RE = re.compile(
+    r'\b(?:achiev(?:e|es|ed|ing)|develop(?:s|ed|ing)?|implement(?:s|ed|ing)?|manag(?:e|es|ed|ing)'
+    r'|lead(?:s|ing)?|led|creat(?:e|es|ed|ing)|improv(?:e|es|ed|ing)|increas(?:e|es|ed|ing)'
+    r'|optimi[sz](?:e|es|ed|ing)|deliver(?:s|ed|ing)?)\b'
+)
+_BULLET_RE = re.compile(r'[•*-]\s')
+_YEAR_RE = re.compile(r'\d{4}')
+
+# Literal (substring) keyword groups consumed by ATSAnalyzer._score_all; frozensets so the
+# per-analysis hit grouping in _scan_keywords is a frozenset-frozenset intersection
+_KEYWORD_GROUPS: Dict[str, FrozenSet[str]] = {
+    'sections': frozenset({'experience', 'education', 'skills', 'summary', 'objective'}),
+    'experience_markers': frozenset({'experience', 'work', 'employment'}),
+    'tech_skills': frozenset({'python', 'java', 'javascript', 'sql', 'aws', 'docker', 'git'}),
+    'soft_skills': frozenset({'leadership', 'communication', 'problem-solving', 'analytical'}),
+    'achievements': frozenset({'achieved', 'improved', 'increased', 'reduced', 'implemented'}),
+    'degrees': frozenset({'bachelor', 'master', 'phd', 'doctorate', 'associate', 'diploma'}),
+    'institutions': frozenset({'university', 'college', 'institute'}),
+    'cliches': frozenset({'team player', 'hard worker', 'detail-oriented', 'self-motivated'}),
+    'contact': frozenset({'linkedin'}),
+}
+_INDUSTRY_TERMS = frozenset({'python', 'java', 'sql', 'aws', 'docker', 'kubernetes'})
+_ALL_KEYWORDS = frozenset(kw for group in _KEYWORD_GROUPS.values() for kw in group)
+
+# Overall-score weights: keyword, format, readability, content, contact, skills, experience, education
+_SCORE_WEIGHTS: Tuple[float, ...] = (0.25, 0.15, 0.10, 0.15, 0.10, 0.10, 0.10, 0.05)
+_WEIGHT_VEC = np.array(_SCORE_WEIGHTS, dtype=np.float64) if np is not None else None
+
+
+def _combine_scores(rows: List[Tuple[float, ...]]) -> List[float]:
+    """Weighted overall score (0-100) per row of sub-scores; a single matmul when NumPy is present."""
+    if _WEIGHT_VEC is not None and rows:
+        return (np.asarray(rows, dtype=np.float64) @ _WEIGHT_VEC * 100).tolist()
+    return [sum(score * weight for score, weight in zip(row, _SCORE_WEIGHTS)) * 100 for row in rows]
+
+
+def _digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+def _result_key(resume_text: str, job_description: Optional[str], target_role: Optional[str]) -> bytes:
+    """Fixed-size digests of the inputs plus the role; the texts themselves are never held as keys."""
+    return _digest(resume_text) + _digest(job_description or '') + (target_role or '').encode('utf-8', 'surrogatepass')
+
+
+def _scan_keywords(lower: str) -> Dict[str, FrozenSet[str]]:
+    """Test every distinct keyword once against the lowered text; hits grouped by category.
+
+    Substring semantics are kept (overlaps such as java/javascript both count).
+    """
+    found = frozenset(kw for kw in _ALL_KEYWORDS if kw in lower)
+    return {group: found.intersection(kws) for group, kws in _KEYWORD_GROUPS.items()}
+
+
+@dataclass(repr=False)
+class _Ctx:
+    """Derived views of one resume, built once per analysis and shared by the helpers."""
+    resume_text: str
+    lower: str
+    doc: Any
+    tokens_set: FrozenSet[str]
+    word_count: int
+    hits: Dict[str, FrozenSet[str]]
+    # Filled once by ATSAnalyzer._keywords (job side is empty without a job description)
+    resume_keywords: Optional[List[str]] = None
+    job_keywords: Optional[List[str]] = None
+    resume_keyword_set: FrozenSet[str] = frozenset()
+    job_keyword_set: FrozenSet[str] = frozenset()
+
+    @classmethod
+    def build(cls, resume_text: str, doc: Any = None) -> "_Ctx":
+        lower = resume_text.lower()
+        words = lower.split()  # one whitespace tokenization feeds both the token set and the word count
+        return cls(resume_text, lower, doc, frozenset(words), len(words), _scan_keywords(lower))
+
+    def __repr__(self) -> str:
+        # Kept O(1): log_function reprs call arguments, and the default would dump the whole resume
+        return f"_Ctx(chars={len(self.resume_text)}, words={self.word_count}, parsed={self.doc is not None})"
+
+    @cached_property
+    def lines(self) -> List[Tuple[str, str]]:
+        """Non-empty lines (stripped) paired with their lowercase form, split once for the format scorers."""
+        return [
+            (stripped, lower_line)
+            for line, lower_line in zip(self.resume_text.split('\n'), self.lower.split('\n'))
+            if (stripped := line.strip())
+        ]
+
+    @cached_property
+    def flesch(self) -> Optional[float]:
+        """Flesch reading ease, computed on first use and shared by the readability consumers.
+
+        None when the calculation fails, so one bad input cannot abort the whole analysis gather.
+        """
+        try:
+            return flesch_reading_ease(self.resume_text)
+        except Exception:
+            return None
+
 
 @dataclass
 class ATSScore:
     """ATS compatibility score breakdown."""
+    # Declared by hand rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = (
+        'overall_score', 'keyword_score', 'format_score', 'readability_score', 'content_score',
+        'contact_score', 'skills_score', 'experience_score', 'education_score',
+    )
     overall_score: float
     keyword_score: float
     format_score: float
@@ -61,12 +211,43 @@ class ATSScore:
     education_score: float
     
     def to_dict(self) -> Dict[str, float]:
-        return asdict(self)
+        # Flat float fields: a literal avoids asdict's reflective, recursively copying walk
+        return {
+            'overall_score': self.overall_score,
+            'keyword_score': self.keyword_score,
+            'format_score': self.format_score,
+            'readability_score': self.readability_score,
+            'content_score': self.content_score,
+            'contact_score': self.contact_score,
+            'skills_score': self.skills_score,
+            'experience_score': self.experience_score,
+            'education_score': self.education_score,
+        }
+
+
+def _ats_score(sub_scores: Tuple[float, ...], overall_score: float) -> ATSScore:
+    """Round 0-1 sub-scores (``_SCORE_WEIGHTS`` order) and the overall score into an ATSScore."""
+    keyword, fmt, readability, content, contact, skills, experience, education = sub_scores
+    return ATSScore(
+        overall_score=round(overall_score, 1),
+        keyword_score=round(keyword * 100, 1),
+        format_score=round(fmt * 100, 1),
+        readability_score=round(readability * 100, 1),
+        content_score=round(content * 100, 1),
+        contact_score=round(contact * 100, 1),
+        skills_score=round(skills * 100, 1),
+        experience_score=round(experience * 100, 1),
+        education_score=round(education * 100, 1)
+    )
 
 
 @dataclass
 class ResumeAnalysis:
     """Comprehensive resume analysis results."""
+    __slots__ = (
+        'ats_score', 'strengths', 'weaknesses', 'suggestions', 'keyword_analysis', 'skills_analysis',
+        'content_analysis', 'format_analysis', 'ai_insights', 'processing_time', 'timestamp',
+    )
     ats_score: ATSScore
     strengths: List[str]
     weaknesses: List[str]
@@ -84,6 +265,12 @@ class ResumeAnalysis:
         result['timestamp'] = self.timestamp.isoformat()
         return result
 
+    def to_json(self) -> bytes:
+        """``to_dict()`` as JSON bytes; orjson serializes the dataclass directly, skipping the asdict copy."""
+        if orjson is not None:
+            return orjson.dumps(self)
+        return json.dumps(self.to_dict()).encode('utf-8')
+
 
 class ATSAnalyzer:
     """Enterprise-grade ATS compatibility analyzer."""
@@ -95,28 +282,73 @@ class ATSAnalyzer:
         """
         self.text_processor = TextProcessor()
         self.keyword_extractor = KeywordExtractor()
+        # Static vocabulary for the no-JD keyword score; built once instead of on every analysis
+        generic = self.keyword_extractor.extract_generic_keywords()
+        self._generic_keywords: Tuple[List[str], FrozenSet[str]] = (generic, frozenset(generic))
         self.sentiment_analyzer = SentimentAnalyzer()
-        self.nlp = None
-        self.nlp_mode = "unavailable"
+        self._result_cache: "OrderedDict[bytes, Tuple[float, ResumeAnalysis]]" = OrderedDict()
+        self._inflight: Dict[bytes, "asyncio.Task[ResumeAnalysis]"] = {}
+        self._keyword_cache: "OrderedDict[bytes, Tuple[List[str], FrozenSet[str]]]" = OrderedDict()
+        # The spaCy pipeline is loaded on first use (see ``nlp``), so constructing an analyzer
+        # in a worker that never analyzes anything stays cheap.
+        self._nlp: Any = None
+        self._nlp_mode = "unavailable"
+        self._nlp_loaded = False
+        self._nlp_lock = threading.Lock()
+        self._skill_matcher: Any = None
+        self._soft_match_id: Optional[int] = None
+
+    @property
+    def nlp(self) -> Any:
+        """spaCy pipeline (None when unavailable), loaded on first access."""
+        self._ensure_nlp()
+        return self._nlp
+
+    @nlp.setter
+    def nlp(self, value: Any) -> None:
+        # An injected pipeline replaces the lazy load; the skill matcher follows its vocab.
+        with self._nlp_lock:
+            self._nlp = value
+            self._nlp_loaded = True
+            self._skill_matcher, self._soft_match_id = self._build_skill_matcher()
+
+    @property
+    def nlp_mode(self) -> str:
+        """Which pipeline ``nlp`` is: a model name, ``blank_en`` or ``unavailable``."""
+        self._ensure_nlp()
+        return self._nlp_mode
+
+    @nlp_mode.setter
+    def nlp_mode(self, value: str) -> None:
+        self._ensure_nlp()
+        self._nlp_mode = value
 
+    def _ensure_nlp(self) -> None:
+        if self._nlp_loaded:
+            return
+        with self._nlp_lock:  # a shared analyzer may be first used from several threads at once
+            if not self._nlp_loaded:
+                self._load_nlp()
+                self._nlp_loaded = True
+
+    def _load_nlp(self) -> None:
         if spacy:
-            # Deterministic CI: exclude the large model attempt from coverage because CI images
-            # intentionally omit heavy language packages; this prevents flaky threshold shifts.
-            # Try large model first (excluded), then small model, then blank pipeline.
-            try:  # pragma: no cover (en_core_web_lg not installed in CI, path unreachable there)
-                self.nlp = spacy.load("en_core_web_lg")  # type: ignore  # pragma: no cover
-                self.nlp_mode = "en_core_web_lg"  # pragma: no cover
-            except Exception:
-                # Attempt lightweight small model (covered when installed locally)
+            # Try the small model, then the large one, then a blank pipeline. The small model is
+            # preferred: the large one only adds word vectors, which are never read.
+            # Only tokens, POS tags, lemmas and sentence boundaries are consumed downstream,
+            # so NER and the dependency parser are disabled and a sentencizer supplies `doc.sents`.
+            for model in ("en_core_web_sm", "en_core_web_lg"):
                 try:
-                    self.nlp = spacy.load("en_core_web_sm")  # type: ignore
-                    self.nlp_mode = "en_core_web_sm"
+                    self._nlp = spacy.load(model, disable=_UNUSED_PIPES)  # type: ignore
+                    self._nlp.add_pipe("sentencizer")
+                    self._nlp_mode = model
+                    break
                 except Exception:
-                    self.nlp = None
-            if self.nlp is None:
+                    self._nlp = None
+            if self._nlp is None:
                 try:
-                    self.nlp = spacy.blank("en")  # minimal tokenizer
-                    self.nlp_mode = "blank_en"
+                    self._nlp = spacy.blank("en")  # minimal tokenizer
+                    self._nlp_mode = "blank_en"
                     logger.warning(
                         "spaCy models not installed; using blank 'en' model. Install with: python -m spacy download en_core_web_sm"
                     )
@@ -126,6 +358,21 @@ class ATSAnalyzer:
             logger.warning(
                 "spaCy not installed; NLP features degraded. Install with: pip install spacy && python -m spacy download en_core_web_sm"
             )
+        self._skill_matcher, self._soft_match_id = self._build_skill_matcher()
+
+    def _build_skill_matcher(self) -> Tuple[Any, Optional[int]]:  # pragma: no cover (requires spaCy; CI images omit it)
+        """Case-insensitive PhraseMatcher over the skill vocabularies; (None, None) without spaCy."""
+        if self._nlp is None:
+            return None, None
+        try:
+            from spacy.matcher import PhraseMatcher  # type: ignore
+            matcher = PhraseMatcher(self._nlp.vocab, attr="LOWER")
+            matcher.add("TECH_SKILL", list(self._nlp.tokenizer.pipe(_TECH_SKILL_TERMS)))
+            matcher.add("SOFT_SKILL", list(self._nlp.tokenizer.pipe(_SOFT_SKILL_TERMS)))
+            return matcher, self._nlp.vocab.strings["SOFT_SKILL"]
+        except Exception as e:
+            logger.debug(f"PhraseMatcher unavailable; skills fall back to regex: {e}")
+            return None, None
 
     # Legacy external AI clients removed.
     
@@ -136,31 +383,125 @@ class ATSAnalyzer:
         job_description: Optional[str] = None,
         target_role: Optional[str] = None
     ) -> ResumeAnalysis:
-        """Run full resume analysis (now fully offline heuristic insights)."""
-        start_time = datetime.now()
-
-        tasks = [
-            self._analyze_ats_compatibility(resume_text, job_description),
-            self._analyze_keywords(resume_text, job_description),
-            self._analyze_skills(resume_text),
-            self._analyze_content_quality(resume_text),
-            self._analyze_format_structure(resume_text),
-            self._get_inhouse_insights_wrapper(resume_text, job_description, target_role)
-        ]
+        """Run full resume analysis (now fully offline heuristic insights).
 
-        results = await asyncio.gather(*tasks)
-        ats_score = results[0]
-        keyword_analysis = results[1]
-        skills_analysis = results[2]
-        content_analysis = results[3]
-        format_analysis = results[4]
-        ai_insights = results[5] if len(results) > 5 else {}
+        Results are memoized by content hash, so re-scoring an unchanged resume/JD/role is a lookup,
+        and concurrent identical requests share one in-flight analysis instead of each running it.
+        """
+        key = _result_key(resume_text, job_description, target_role)
+        cached = self._cached_result(key)
+        if cached is not None:
+            return cached
+        task = self._inflight.get(key)
+        # Coalesce only within one event loop (a shared analyzer may serve several threads' loops)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._analyze_uncached(key, resume_text, job_description, target_role))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._inflight.pop(key, None) if self._inflight.get(key) is done else None)
+            # Shielded so a cancelled first caller does not cancel the analysis other callers await
+            return await asyncio.shield(task)
+        result = await asyncio.shield(task)
+        # Followers take their own copy from the cache; the first caller owns ``result``
+        return self._cached_result(key) or copy.deepcopy(result)
+
+    async def _analyze_uncached(
+        self,
+        key: bytes,
+        resume_text: str,
+        job_description: Optional[str],
+        target_role: Optional[str]
+    ) -> ResumeAnalysis:
+        # Single spaCy pass shared by every helper that needs tokens/POS/sentences.
+        doc = await self._parse_async(resume_text)
+        return self._store_result(key, await self._analyze_parsed(resume_text, job_description, target_role, doc))
+
+    @log_function("INFO", "ANALYZE_BATCH_OK")
+    async def analyze_batch(
+        self,
+        resumes: List[str],
+        job_descriptions: Optional[List[Optional[str]]] = None,
+        target_role: Optional[str] = None,
+        batch_size: int = 64,
+        n_process: int = 1
+    ) -> List[ResumeAnalysis]:
+        """Analyze many resumes, parsing them through one batched ``nlp.pipe`` call.
+
+        ``n_process=-1`` spreads parsing over all cores for large offline jobs; the default
+        of 1 avoids worker start-up cost on request-sized batches.
+        """
+        jds = job_descriptions if job_descriptions is not None else [None] * len(resumes)
+        if len(jds) != len(resumes):
+            raise ValueError("job_descriptions must have one entry per resume")
+        keys = [_result_key(text, jd, target_role) for text, jd in zip(resumes, jds)]
+        results: List[Optional[ResumeAnalysis]] = [self._cached_result(key) for key in keys]
+        misses = [i for i, result in enumerate(results) if result is None]
+        docs = await asyncio.to_thread(self._parse_many, [resumes[i] for i in misses], batch_size, n_process)
+        await self._prefetch_keywords([resumes[i] for i in misses] + [jds[i] for i in misses])
+        computed = await asyncio.gather(*(
+            self._analyze_parsed(resumes[i], jds[i], target_role, doc)
+            for i, doc in zip(misses, docs)
+        ))
+        for i, result in zip(misses, computed):
+            results[i] = self._store_result(keys[i], result)
+        return results  # type: ignore[return-value]
+
+    def _cached_result(self, key: bytes) -> Optional[ResumeAnalysis]:
+        """Fresh copy of a memoized analysis, or None when absent/expired."""
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            self._result_cache.pop(key, None)
+            return None
+        try:
+            self._result_cache.move_to_end(key)
+        except KeyError:  # evicted concurrently by another thread; the copy below is still valid
+            pass
+        return copy.deepcopy(result)
+
+    def _store_result(self, key: bytes, result: ResumeAnalysis) -> ResumeAnalysis:
+        """Memoize a private copy of ``result`` (callers may mutate theirs) and return it."""
+        self._result_cache[key] = (time.monotonic() + _RESULT_CACHE_TTL, copy.deepcopy(result))
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > _RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+        return result
+
+    async def _analyze_parsed(
+        self,
+        resume_text: str,
+        job_description: Optional[str],
+        target_role: Optional[str],
+        doc: Any
+    ) -> ResumeAnalysis:
+        """Analysis body shared by single and batch entrypoints (``doc`` already parsed)."""
+        start_time = datetime.now()  # reported timestamp; the duration uses the monotonic perf counter
+        started = time.perf_counter()
+        ctx = _Ctx.build(resume_text, doc)
+        if _HAS_TEXTSTAT:
+            # textstat's syllable counting also blocks; warm ctx.flesch in a worker during keyword extraction
+            await asyncio.gather(self._keywords(ctx, job_description), asyncio.to_thread(getattr, ctx, 'flesch'))
+        else:
+            await self._keywords(ctx, job_description)
+
+        ats_score, keyword_analysis, skills_analysis, content_analysis, format_analysis = await asyncio.gather(
+            self._analyze_ats_compatibility(resume_text, job_description, ctx),
+            self._analyze_keywords(resume_text, job_description, ctx),
+            self._analyze_skills(resume_text, ctx),
+            self._analyze_content_quality(resume_text, ctx),
+            self._analyze_format_structure(resume_text, ctx),
+        )
+        # Insights are derived from the analyses above rather than recomputing them
+        ai_insights = self._get_inhouse_insights(
+            ats_score, keyword_analysis, skills_analysis, content_analysis, format_analysis, target_role
+        )
 
         strengths, weaknesses, suggestions = self._generate_recommendations(
             ats_score, keyword_analysis, skills_analysis, content_analysis, format_analysis, ai_insights
         )
 
-        processing_time = (datetime.now() - start_time).total_seconds()
+        processing_time = time.perf_counter() - started
         return ResumeAnalysis(
             ats_score=ats_score,
             strengths=strengths,
@@ -174,398 +515,394 @@ class ATSAnalyzer:
             processing_time=processing_time,
             timestamp=start_time
         )
+
+    def _parse(self, resume_text: str) -> Any:
+        """Run the spaCy pipeline once; None when NLP is unavailable or parsing fails."""
+        if not self.nlp:
+            return None
+        try:
+            return self.nlp(resume_text)
+        except Exception as e:
+            logger.debug(f"spaCy parse failed; helpers fall back to regex tokenization: {e}")
+            return None
+
+    async def _parse_async(self, resume_text: str) -> Any:
+        """``_parse`` on a worker thread so the pipeline (GIL released in Cython) never blocks the loop."""
+        if not self._nlp_loaded:
+            await asyncio.to_thread(self._ensure_nlp)  # first use: load the model off the loop too
+        if not self.nlp:
+            return None
+        return await asyncio.to_thread(self._parse, resume_text)
+
+    def _parse_many(self, texts: List[str], batch_size: int = 64, n_process: int = 1) -> List[Any]:
+        """Batch counterpart of ``_parse`` built on ``nlp.pipe``; one entry per text."""
+        if not self.nlp:
+            return [None] * len(texts)
+        pipe = getattr(self.nlp, 'pipe', None)
+        if pipe is None:
+            return [self._parse(t) for t in texts]
+        try:
+            return list(pipe(texts, batch_size=batch_size, n_process=n_process))
+        except Exception as e:
+            logger.debug(f"Batched spaCy parse failed; parsing individually: {e}")
+            return [self._parse(t) for t in texts]
     
     @log_function("METRIC", "ATS_COMPAT_OK")
     async def _analyze_ats_compatibility(
         self, 
         resume_text: str, 
-        job_description: Optional[str] = None
+        job_description: Optional[str] = None,
+        ctx: Optional[_Ctx] = None
     ) -> ATSScore:
         """Analyze ATS compatibility and generate detailed score."""
+        sub_scores = await self._sub_scores(resume_text, job_description, ctx)
+        return _ats_score(sub_scores, _combine_scores([sub_scores])[0])
+
+    @log_function("METRIC", "ATS_BATCH_SCORE_OK")
+    async def batch_score(
+        self,
+        resumes: List[str],
+        job_descriptions: Optional[List[Optional[str]]] = None
+    ) -> List[ATSScore]:
+        """Score many resumes, combining the (N, 8) sub-score matrix in one weighted matmul."""
+        jds = job_descriptions if job_descriptions is not None else [None] * len(resumes)
+        if len(jds) != len(resumes):
+            raise ValueError("job_descriptions must have one entry per resume")
+        await self._prefetch_keywords([*resumes, *jds])
+        rows = await asyncio.gather(*(self._sub_scores(text, jd) for text, jd in zip(resumes, jds)))
+        return [_ats_score(row, overall) for row, overall in zip(rows, _combine_scores(rows))]
+
+    async def _sub_scores(
+        self,
+        resume_text: str,
+        job_description: Optional[str] = None,
+        ctx: Optional[_Ctx] = None
+    ) -> Tuple[float, ...]:
+        """The eight 0-1 sub-scores, ordered as ``_SCORE_WEIGHTS``."""
+        ctx = ctx or _Ctx.build(resume_text)
         
         # Keyword matching score
-        keyword_score = await self._calculate_keyword_score(resume_text, job_description)
-        format_score = self._calculate_format_score(resume_text)
-        readability_score = self._calculate_readability_score(resume_text)
-        content_score = self._calculate_content_score(resume_text)
-        contact_score = self._calculate_contact_score(resume_text)
-        skills_score = self._calculate_skills_score(resume_text)
-        experience_score = self._calculate_experience_score(resume_text)
-        education_score = self._calculate_education_score(resume_text)
-        
-        # Calculate overall weighted score
-        weights = {
-            'keyword': 0.25,
-            'format': 0.15,
-            'readability': 0.10,
-            'content': 0.15,
-            'contact': 0.10,
-            'skills': 0.10,
-            'experience': 0.10,
-            'education': 0.05
-        }
-        
-        overall_score = (
-            keyword_score * weights['keyword'] +
-            format_score * weights['format'] +
-            readability_score * weights['readability'] +
-            content_score * weights['content'] +
-            contact_score * weights['contact'] +
-            skills_score * weights['skills'] +
-            experience_score * weights['experience'] +
-            education_score * weights['education']
-        ) * 100
-        
-        return ATSScore(
-            overall_score=round(overall_score, 1),
-            keyword_score=round(keyword_score * 100, 1),
-            format_score=round(format_score * 100, 1),
-            readability_score=round(readability_score * 100, 1),
-            content_score=round(content_score * 100, 1),
-            contact_score=round(contact_score * 100, 1),
-            skills_score=round(skills_score * 100, 1),
-            experience_score=round(experience_score * 100, 1),
-            education_score=round(education_score * 100, 1)
-        )
+        keyword_score = await self._calculate_keyword_score(resume_text, job_description, ctx)
+        return (keyword_score,) + self._score_all(ctx)
     
     @log_function("DEBUG", "KW_SCORE_OK")
     async def _calculate_keyword_score(
         self, 
         resume_text: str, 
-        job_description: Optional[str] = None
+        job_description: Optional[str] = None,
+        ctx: Optional[_Ctx] = None
     ) -> float:
         """Calculate keyword matching score."""
+        ctx = ctx or _Ctx.build(resume_text)
+        await self._keywords(ctx, job_description)
         if not job_description:
             # Use generic tech keywords if no job description provided
-            job_keywords = self.keyword_extractor.extract_generic_keywords()
+            job_keywords, job_keyword_set = self._generic_keywords
         else:
-            job_keywords = await self.keyword_extractor.extract_keywords(job_description)
-        
-        resume_keywords = await self.keyword_extractor.extract_keywords(resume_text)
+            job_keywords, job_keyword_set = ctx.job_keywords, ctx.job_keyword_set
         
         if not job_keywords:
             return 0.7  # Neutral score if no keywords to match
         
-        matches = len(set(job_keywords) & set(resume_keywords))
+        matches = len(job_keyword_set & ctx.resume_keyword_set)
         return min(matches / len(job_keywords), 1.0)
+
+    async def _keywords(self, ctx: _Ctx, job_description: Optional[str]) -> None:
+        """Extract resume/JD keywords into ``ctx`` once; scoring and keyword analysis both reuse them.
+
+        Extractions are memoized by text digest, so a resume re-scored against another JD, or one JD
+        scored against many resumes, is extracted only once.
+        """
+        if ctx.job_keywords is None and not job_description:
+            ctx.job_keywords, ctx.job_keyword_set = [], frozenset()
+        pending = {}
+        if ctx.resume_keywords is None:
+            pending[_digest(ctx.resume_text)] = ctx.resume_text
+        if ctx.job_keywords is None:
+            pending[_digest(job_description)] = job_description
+        found = {}
+        for key in pending:
+            entry = self._keyword_cache.get(key)
+            if entry is not None:
+                found[key] = entry
+                try:
+                    self._keyword_cache.move_to_end(key)
+                except KeyError:  # evicted concurrently by another thread's analysis
+                    pass
+        misses = {key: text for key, text in pending.items() if key not in found}
+        if misses:
+            found.update(await self._extract_keywords(misses))
+        # Cached lists are shared between analyses; consumers only slice them
+        if ctx.resume_keywords is None:
+            ctx.resume_keywords, ctx.resume_keyword_set = found[_digest(ctx.resume_text)]
+        if ctx.job_keywords is None:
+            ctx.job_keywords, ctx.job_keyword_set = found[_digest(job_description)]
     
-    @log_function("DEBUG", "FORMAT_OK")
-    def _calculate_format_score(self, resume_text: str) -> float:
-        """Calculate format compatibility score."""
-        score = 0.0
-        
-        # Check for proper sections
-        sections = ['experience', 'education', 'skills', 'summary', 'objective']
-        found_sections = sum(1 for section in sections if section in resume_text.lower())
-        score += (found_sections / len(sections)) * 0.3
+    async def _extract_keywords(self, texts: Dict[bytes, str]) -> Dict[bytes, Tuple[List[str], FrozenSet[str]]]:
+        """Extract digest-keyed texts in one batched extractor call and memoize the results."""
+        extracted = await self.keyword_extractor.extract_keywords_batch(list(texts.values()))
+        entries = {key: (keywords, frozenset(keywords)) for key, keywords in zip(texts, extracted)}
+        self._keyword_cache.update(entries)
+        while len(self._keyword_cache) > _KEYWORD_CACHE_SIZE:
+            self._keyword_cache.popitem(last=False)
+        return entries
+
+    async def _prefetch_keywords(self, texts: List[Optional[str]]) -> None:
+        """Warm the keyword cache for a batch before fanning out.
+
+        Gathered analyses would otherwise all miss at once, re-extracting a shared JD per resume.
+        """
+        pending = {}
+        for text in texts:
+            if text:
+                key = _digest(text)
+                if key not in self._keyword_cache:
+                    pending.setdefault(key, text)
+        if pending:
+            await self._extract_keywords(pending)
+
+    @log_function("DEBUG", "SCORE_ALL_OK")
+    def _score_all(self, ctx: _Ctx) -> Tuple[float, ...]:
+        """Format, readability, content, contact, skills, experience and education scores in one pass.
+
+        Returned in ``_SCORE_WEIGHTS`` order (everything after the keyword score).
+        """
+        resume_text = ctx.resume_text
+        hits = ctx.hits
+        word_count = ctx.word_count
         
-        # Check for bullet points
+        # --- Format: sections, bullets, capitalization, length ---
+        fmt = (len(hits['sections']) / len(_KEYWORD_GROUPS['sections'])) * 0.3
         if '•' in resume_text or '*' in resume_text or '-' in resume_text:
-            score += 0.2
-        
-        # Check for consistent formatting patterns
-        lines = resume_text.split('\n')
-        non_empty_lines = [line.strip() for line in lines if line.strip()]
-        
-        # Check for consistent capitalization
-        if non_empty_lines:
-            proper_caps = sum(1 for line in non_empty_lines if line[0].isupper()) / len(non_empty_lines)
-            score += proper_caps * 0.2
+            fmt += 0.2
+        lines = ctx.lines
+        if lines:
+            fmt += sum(1 for line, _ in lines if line[0].isupper()) / len(lines) * 0.2
         else:
-            # Neutral contribution if empty
-            score += 0.1
-        
-        # Check for appropriate length
-        word_count = len(resume_text.split())
+            fmt += 0.1  # Neutral contribution if empty
         if 300 <= word_count <= 800:
-            score += 0.3
+            fmt += 0.3
         elif 200 <= word_count < 300 or 800 < word_count <= 1200:
-            score += 0.2
+            fmt += 0.2
         else:
-            score += 0.1
-        
-        return min(score, 1.0)
-    
-    @log_function("DEBUG", "READABILITY_OK")
-    def _calculate_readability_score(self, resume_text: str) -> float:
-        """Calculate readability score using various metrics."""
-        try:
-            flesch_score = flesch_reading_ease(resume_text)
-            
-            # Normalize Flesch score (0-100) to 0-1
-            # Target range: 60-80 (standard reading level)
-            if 60 <= flesch_score <= 80:
-                readability = 1.0
-            elif 40 <= flesch_score < 60 or 80 < flesch_score <= 90:
-                readability = 0.8
-            elif 20 <= flesch_score < 40 or 90 < flesch_score <= 100:
-                readability = 0.6
-            else:
-                readability = 0.4
-            
-            return readability
-        except:
-            return 0.7  # Neutral score if calculation fails
-    
-    @log_function("DEBUG", "CONTENT_OK")
-    def _calculate_content_score(self, resume_text: str) -> float:
-        """Calculate content quality score (robust without spaCy)."""
-        score = 0.0
-        
-        # Check for quantifiable achievements
-        numbers = re.findall(r'\d+[%]?|\$\d+', resume_text)
-        score += 0.3 if len(numbers) >= 5 else 0.2 if len(numbers) >= 2 else 0.1
-        
-        # Check for strong action verbs
-        strong_verbs = ['achieve','develop','implement','manage','lead','create','improve','increase','optimize','deliver']
-        if self.nlp:
-            try:
-                doc = self.nlp(resume_text)
-                verbs = [t.lemma_.lower() for t in doc if getattr(t, 'pos_', None) == 'VERB']
-            except Exception:
-                verbs = []
+            fmt += 0.1
+        
+        # --- Readability: Flesch 60-80 is the target (standard reading level) ---
+        flesch_score = ctx.flesch
+        if flesch_score is None:
+            readability = 0.7  # Neutral score if calculation fails
+        elif 60 <= flesch_score <= 80:
+            readability = 1.0
+        elif 40 <= flesch_score < 60 or 80 < flesch_score <= 90:
+            readability = 0.8
+        elif 20 <= flesch_score < 40 or 90 < flesch_score <= 100:
+            readability = 0.6
         else:
-            # Heuristic fallback: simple word match
-            tokens = [w.lower() for w in re.findall(r'[A-Za-z]+', resume_text)]
-            verbs = [w for w in tokens if w in strong_verbs]
-        strong_verb_count = sum(1 for v in verbs if v in strong_verbs)
-        score += min(strong_verb_count / 10, 0.25)
-        
-        # Check for industry-relevant keywords
-        score += min(len(set(resume_text.lower().split()) & 
-                    set(['python','java','sql','aws','docker','kubernetes'])) / 20, 0.2)
-        
-        # Check against clichés
-        cliches = ['team player','hard worker','detail-oriented','self-motivated']
-        cliche_count = sum(1 for c in cliches if c in resume_text.lower())
-        score += max(0.25 - (cliche_count * 0.1), 0)
-        
-        return min(score, 1.0)
-    
-    @log_function("DEBUG", "CONTACT_OK")
-    def _calculate_contact_score(self, resume_text: str) -> float:
-        """Calculate contact information completeness score."""
-        score = 0.0
-        
-        # Email
-        if re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', resume_text):
-            score += 0.3
-        
-        # Phone
-        if re.search(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', resume_text):
-            score += 0.3
-        
-        # LinkedIn
-        if 'linkedin' in resume_text.lower():
-            score += 0.2
-        
-        # Location/Address
-        if re.search(r'\b(street|st\.|avenue|ave\.|road|rd\.|city|state)\b', resume_text.lower()):
-            score += 0.2
-        
-        return min(score, 1.0)
-    
-    @log_function("DEBUG", "SKILLS_OK")
-    def _calculate_skills_score(self, resume_text: str) -> float:
-        """Calculate skills section quality score."""
-        score = 0.0
-        
-        # Check for dedicated skills section
-        if 'skills' in resume_text.lower():
-            score += 0.4
-        
-        # Check for technical skills
-        tech_skills = ['python', 'java', 'javascript', 'sql', 'aws', 'docker', 'git']
-        found_tech = sum(1 for skill in tech_skills if skill in resume_text.lower())
-        score += min(found_tech / len(tech_skills), 0.3)
-        
-        # Check for soft skills
-        soft_skills = ['leadership', 'communication', 'problem-solving', 'analytical']
-        found_soft = sum(1 for skill in soft_skills if skill in resume_text.lower())
-        score += min(found_soft / len(soft_skills), 0.3)
-        
-        return min(score, 1.0)
-    
-    @log_function("DEBUG", "EXPERIENCE_OK")
-    def _calculate_experience_score(self, resume_text: str) -> float:
-        """Calculate experience section quality score."""
-        score = 0.0
-        
-        # Check for experience section
-        if any(keyword in resume_text.lower() for keyword in ['experience', 'work', 'employment']):
-            score += 0.3
-        
-        # Check for company names and dates
-        date_patterns = [
-            r'\d{4}[-/]\d{4}',  # 2020-2021
-            r'\d{4}\s*[-–]\s*\d{4}',  # 2020 - 2021
-            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec).*\d{4}',  # Month Year
-        ]
-        
-        dates_found = sum(1 for pattern in date_patterns 
-                         if re.search(pattern, resume_text, re.IGNORECASE))
-        score += min(dates_found / 3, 0.4)
-        
-        # Check for achievement-oriented descriptions
-        achievement_words = ['achieved', 'improved', 'increased', 'reduced', 'implemented']
-        achievements = sum(1 for word in achievement_words if word in resume_text.lower())
-        score += min(achievements / 5, 0.3)
-        
-        return min(score, 1.0)
-    
-    def _calculate_education_score(self, resume_text: str) -> float:
-        """Calculate education section quality score."""
-        score = 0.0
-        
-        # Check for education section
-        if 'education' in resume_text.lower():
-            score += 0.4
-        
-        # Check for degree mentions
-        degrees = ['bachelor', 'master', 'phd', 'doctorate', 'associate', 'diploma']
-        found_degrees = sum(1 for degree in degrees if degree in resume_text.lower())
-        score += min(found_degrees / 2, 0.3)
-        
-        # Check for institutions
-        if any(word in resume_text.lower() for word in ['university', 'college', 'institute']):
-            score += 0.3
-        
-        return min(score, 1.0)
+            readability = 0.4
+        
+        # --- Content: quantified achievements, action verbs, industry terms, clichés ---
+        n_numbers = len(_NUM_RE.findall(resume_text))
+        content = 0.3 if n_numbers >= 5 else 0.2 if n_numbers >= 2 else 0.1
+        content += min(len(_STRONG_VERB_RE.findall(ctx.lower)) / 10, 0.25)
+        content += min(len(ctx.tokens_set & _INDUSTRY_TERMS) / 20, 0.2)
+        content += max(0.25 - (len(hits['cliches']) * 0.1), 0)
+        
+        # --- Contact: email, phone, LinkedIn/GitHub, location ---
+        contact = 0.0
+        if '@' in resume_text and _EMAIL_RE.search(resume_text):
+            contact += 0.3
+        if _PHONE_RE.search(resume_text):
+            contact += 0.3
+        if hits['contact']:
+            contact += 0.2
+        if _ADDR_RE.search(resume_text):
+            contact += 0.2
+        
+        # --- Skills: dedicated section, technical and soft skills ---
+        skills = 0.4 if 'skills' in hits['sections'] else 0.0
+        skills += min(len(hits['tech_skills']) / len(_KEYWORD_GROUPS['tech_skills']), 0.3)
+        skills += min(len(hits['soft_skills']) / len(_KEYWORD_GROUPS['soft_skills']), 0.3)
+        
+        # --- Experience: section markers, dates, achievement language ---
+        experience = 0.3 if hits['experience_markers'] else 0.0
+        dates_found = sum(1 for _ in islice(_DATE_RE.finditer(resume_text), _MAX_DATES))
+        experience += dates_found / _MAX_DATES * 0.4
+        experience += min(len(hits['achievements']) / 5, 0.3)
+        
+        # --- Education: section, degrees, institutions ---
+        education = 0.4 if 'education' in hits['sections'] else 0.0
+        education += min(len(hits['degrees']) / 2, 0.3)
+        if hits['institutions']:
+            education += 0.3
+        
+        return (
+            min(fmt, 1.0),
+            readability,
+            min(content, 1.0),
+            min(contact, 1.0),
+            min(skills, 1.0),
+            min(experience, 1.0),
+            min(education, 1.0),
+        )
     
     async def _analyze_keywords(
         self, 
         resume_text: str, 
-        job_description: Optional[str] = None
+        job_description: Optional[str] = None,
+        ctx: Optional[_Ctx] = None
     ) -> Dict[str, Any]:
         """Analyze keyword usage and relevance."""
-        resume_keywords = await self.keyword_extractor.extract_keywords(resume_text)
+        ctx = ctx or _Ctx.build(resume_text)
+        await self._keywords(ctx, job_description)
+        resume_keywords, job_keywords = ctx.resume_keywords, ctx.job_keywords
         
         if job_description:
-            job_keywords = await self.keyword_extractor.extract_keywords(job_description)
-            matched_keywords = set(resume_keywords) & set(job_keywords)
-            missing_keywords = set(job_keywords) - set(resume_keywords)
+            matched_keywords = ctx.resume_keyword_set & ctx.job_keyword_set
+            missing_keywords = ctx.job_keyword_set - ctx.resume_keyword_set
         else:
-            job_keywords = []
-            matched_keywords = set()
-            missing_keywords = set()
+            matched_keywords = frozenset()
+            missing_keywords = frozenset()
+        word_count = ctx.word_count
         
         return {
             'resume_keywords': resume_keywords[:20],  # Top 20
             'job_keywords': job_keywords[:20] if job_keywords else [],
             'matched_keywords': list(matched_keywords)[:15],
             'missing_keywords': list(missing_keywords)[:10],
-            'keyword_density': (len(resume_keywords) / max(len(resume_text.split()), 1)) * 100,
+            'keyword_density': len(resume_keywords) / word_count * 100 if word_count else 0.0,
             'match_percentage': len(matched_keywords) / len(job_keywords) * 100 if job_keywords else 0
         }
     
-    async def _analyze_skills(self, resume_text: str) -> Dict[str, Any]:
-        """Analyze skills mentioned in the resume."""
-        # Removed unused doc = self.nlp(resume_text) for fallback safety
-        
-        # Extract technical skills
-        technical_skills = []
-        skill_patterns = [
-            r'\b(python|java|javascript|c\+\+|sql|html|css|react|node\.js|aws|docker|kubernetes)\b',
-            r'\b(machine learning|data science|artificial intelligence|deep learning)\b',
-            r'\b(agile|scrum|devops|ci/cd|git|jenkins|terraform)\b'
-        ]
-        
-        for pattern in skill_patterns:
-            technical_skills.extend(re.findall(pattern, resume_text, re.IGNORECASE))
-        
-        # Extract soft skills using NLP
-        soft_skill_keywords = ['leadership','communication','teamwork','problem-solving']
-        soft_skills = [s for s in soft_skill_keywords if s in resume_text.lower()]
+    async def _analyze_skills(self, resume_text: str, ctx: Optional[_Ctx] = None) -> Dict[str, Any]:
+        """Analyze skills mentioned in the resume.
+
+        With a parsed ``ctx.doc`` one PhraseMatcher pass finds both skill kinds; otherwise
+        a single precompiled regex plus substring checks are used.
+        """
+        if self._skill_matcher is not None and ctx is not None and ctx.doc is not None:
+            technical_skills = []
+            found_soft = set()
+            for match_id, start, end in self._skill_matcher(ctx.doc):
+                span = ctx.doc[start:end].text
+                if match_id == self._soft_match_id:
+                    found_soft.add(span.lower())
+                else:
+                    technical_skills.append(span)
+            soft_skills = [s for s in _SOFT_SKILL_TERMS if s in found_soft]
+        else:
+            lower = ctx.lower if ctx else resume_text.lower()
+            technical_skills = _SKILL_RE.findall(resume_text)
+            soft_skills = [s for s in _SOFT_SKILL_TERMS if s in lower]
         
+        # Lowercase each matched skill once for the category checks below
+        tech_lower = [(s, s.lower()) for s in technical_skills]
         return {
             'technical_skills': list(set(technical_skills)),
             'soft_skills': soft_skills,
             'skill_count': len(set(technical_skills + soft_skills)),
             'skills_by_category': {
-                'programming': [s for s in technical_skills if s.lower() in ['python','java','javascript','c++']],
-                'cloud': [s for s in technical_skills if s.lower() in ['aws','docker','kubernetes']],
-                'data': [s for s in technical_skills if 'data' in s.lower() or 'machine learning' in s.lower()]
+                'programming': [s for s, low in tech_lower if low in _PROGRAMMING_SKILLS],
+                'cloud': [s for s, low in tech_lower if low in _CLOUD_SKILLS],
+                'data': [s for s, low in tech_lower if 'data' in low or 'machine learning' in low]
             }
         }
     
-    async def _analyze_content_quality(self, resume_text: str) -> Dict[str, Any]:
-        """Analyze overall content quality."""
+    async def _analyze_content_quality(self, resume_text: str, ctx: Optional[_Ctx] = None) -> Dict[str, Any]:
+        """Analyze overall content quality (reuses ``ctx.doc`` when already parsed)."""
+        ctx = ctx or _Ctx.build(resume_text)
         if self.nlp and self.nlp_mode != 'blank_en':
             try:
-                doc = self.nlp(resume_text)
+                doc = ctx.doc if ctx.doc is not None else self.nlp(resume_text)
                 sentences = [s.text for s in doc.sents] or [resume_text]
                 unique_words = len(set(t.lemma_.lower() for t in doc if getattr(t, 'is_alpha', False)))
                 total_words = len([t for t in doc if getattr(t, 'is_alpha', False)])
             except Exception:
-                sentences = re.split(r'[.!?]\s+', resume_text)
-                tokens = re.findall(r'[A-Za-z]+', resume_text)
+                sentences = _SENT_SPLIT_RE.split(resume_text)
+                tokens = _WORD_RE.findall(resume_text)
                 unique_words = len(set(tokens))
                 total_words = len(tokens)
         else:
-            sentences = re.split(r'[.!?]\s+', resume_text)
-            tokens = re.findall(r'[A-Za-z]+', resume_text)
+            sentences = _SENT_SPLIT_RE.split(resume_text)
+            tokens = _WORD_RE.findall(resume_text)
             unique_words = len(set(tokens))
             total_words = len(tokens)
         
         sentiment = self.sentiment_analyzer.analyze_sentiment(resume_text)
-        avg_sentence_length = sum(len(s.split()) for s in sentences) / max(len(sentences), 1)
+        n_sentences = len(sentences)
+        avg_sentence_length = sum(len(s.split()) for s in sentences) / n_sentences if n_sentences else 0.0
         vocabulary_richness = unique_words / total_words if total_words else 0
+        flesch = ctx.flesch
         
         return {
             'sentiment': sentiment,
             'avg_sentence_length': round(avg_sentence_length, 1),
             'vocabulary_richness': round(vocabulary_richness, 3),
-            'readability_score': flesch_reading_ease(resume_text),
+            'readability_score': flesch if flesch is not None else _NEUTRAL_FLESCH,
             'word_count': total_words,
-            'sentence_count': len(sentences),
-            'paragraph_count': len(resume_text.split('\n\n')),
+            'sentence_count': n_sentences,
+            'paragraph_count': resume_text.count('\n\n') + 1,  # == len(split('\n\n')) without the list
             'nlp_mode': self.nlp_mode
         }
     
-    async def _analyze_format_structure(self, resume_text: str) -> Dict[str, Any]:
+    async def _analyze_format_structure(self, resume_text: str, ctx: Optional[_Ctx] = None) -> Dict[str, Any]:
         """Analyze document structure and formatting."""
-        lines = resume_text.split('\n')
-        non_empty_lines = [line.strip() for line in lines if line.strip()]
+        ctx = ctx or _Ctx.build(resume_text)
         
         # Detect sections
-        section_headers = []
-        potential_headers = ['summary', 'experience', 'education', 'skills', 'projects', 'certifications']
-        
-        for line in non_empty_lines:
-            if any(header in line.lower() for header in potential_headers):
-                section_headers.append(line.strip())
+        section_headers = [line for line, lower_line in ctx.lines if _FORMAT_HEADER_RE.search(lower_line)]
         
         # Analyze formatting consistency
-        bullet_points = len(re.findall(r'[•*-]\s', resume_text))
-        date_formats = len(re.findall(r'\d{4}', resume_text))
+        bullet_points = len(_BULLET_RE.findall(resume_text))
+        date_formats = len(_YEAR_RE.findall(resume_text))
         
         return {
             'sections_detected': section_headers,
             'section_count': len(section_headers),
-            'line_count': len(non_empty_lines),
+            'line_count': len(ctx.lines),
             'bullet_points': bullet_points,
             'date_formats_found': date_formats,
             'has_consistent_formatting': len(section_headers) >= 3,
             'estimated_pages': len(resume_text) // 3000 + 1  # Rough estimate
         }
     
-    @log_function("REMARK", "INHOUSE_INSIGHTS_OK")
     async def _get_inhouse_insights_wrapper(
         self,
         resume_text: str,
         job_description: Optional[str] = None,
         target_role: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Generate insights using internal heuristic engine (no external APIs)."""
-        # We need prerequisite partial analyses; replicate minimal subset synchronously (cheap computations already done elsewhere after gather, so rely on simple recompute for isolation if needed)
+        """Standalone insights: run the prerequisite analyses, then generate insights from them.
+
+        ``analyze_resume`` already has these analyses and calls ``_get_inhouse_insights`` directly.
+        """
+        try:
+            ctx = _Ctx.build(resume_text, await self._parse_async(resume_text))
+            await self._keywords(ctx, job_description)
+            ats_score, keyword_analysis, skills_analysis, content_analysis, format_analysis = await asyncio.gather(
+                self._analyze_ats_compatibility(resume_text, job_description, ctx),
+                self._analyze_keywords(resume_text, job_description, ctx),
+                self._analyze_skills(resume_text, ctx),
+                self._analyze_content_quality(resume_text, ctx),
+                self._analyze_format_structure(resume_text, ctx),
+            )
+        except Exception as e:
+            return { 'insights': { 'error': str(e) }, 'source': 'inhouse' }
+        return self._get_inhouse_insights(
+            ats_score, keyword_analysis, skills_analysis, content_analysis, format_analysis, target_role
+        )
+
+    @log_function("REMARK", "INHOUSE_INSIGHTS_OK")
+    def _get_inhouse_insights(
+        self,
+        ats_score: ATSScore,
+        keyword_analysis: Dict[str, Any],
+        skills_analysis: Dict[str, Any],
+        content_analysis: Dict[str, Any],
+        format_analysis: Dict[str, Any],
+        target_role: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Generate insights using internal heuristic engine (no external APIs) from finished analyses."""
         try:
-            # NOTE: For performance, we could refactor to reuse results; kept isolated to avoid coupling gather ordering.
-            keyword_analysis = await self._analyze_keywords(resume_text, job_description)
-            skills_analysis = await self._analyze_skills(resume_text)
-            content_analysis = await self._analyze_content_quality(resume_text)
-            format_analysis = await self._analyze_format_structure(resume_text)
-            # For ATS score parts we can reuse lightweight recalculation
-            ats_score = await self._analyze_ats_compatibility(resume_text, job_description)
             model: InsightGenerator = inhouse_registry.get("insight_generator")  # type: ignore
             payload = {
                 'ats_score': ats_score.to_dict(),
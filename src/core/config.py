@@ -4,24 +4,49 @@ Handles all application settings and environment configuration.
 """
 
 import os
-from typing import List, Optional, Dict, Any
+import atexit
+import threading
+from typing import Iterable, List, Optional, Dict, Any, Tuple
 import json
+from functools import lru_cache
 from pathlib import Path
 from src.utils.system_logger import log_function
 try:
-    from pydantic_settings import BaseSettings  # type: ignore
-    from pydantic import validator  # type: ignore
+    import orjson  # type: ignore
+
+    # Compact output: the file is machine-read, so indentation only costs encode time and bytes.
+    def _prefs_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _prefs_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson optional, fall back to stdlib json
+    def _prefs_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    _prefs_loads = json.loads
+try:
+    from pydantic_settings import BaseSettings, SettingsConfigDict  # type: ignore
+    from pydantic import field_validator  # type: ignore
 except Exception:  # lightweight fallback without pydantic
     class BaseSettings:  # type: ignore
         def __init__(self, **kwargs):
             for k,v in kwargs.items():
                 setattr(self, k, v)
-    def validator(*_args, **_kwargs):  # type: ignore
+    def SettingsConfigDict(**kwargs):  # type: ignore
+        return kwargs
+    def field_validator(*_args, **_kwargs):  # type: ignore
         def wrap(fn):
             return fn
         return wrap
 
 
+_FORMAT_STRIP_TABLE = str.maketrans("", "", '[]"\'')
+_ALL_FORMATS: Tuple[str, ...] = (
+    "pdf", "docx", "latex", "txt", "jpg", "jpeg", "png", "tiff", "pptx", "ppt",
+    "xlsx", "xls", "mp3", "wav", "m4a", "mp4", "avi",
+)
+
+
 class Settings(BaseSettings):
     """Application settings with validation."""
     
@@ -80,7 +105,9 @@ class Settings(BaseSettings):
     
     # File Processing
     max_file_size_mb: int = 50
-    supported_formats: List[str] = ["pdf", "docx", "txt", "jpg", "png", "pptx", "xlsx", "mp3", "mp4"]
+    # Immutable tuples: one shared default instead of a per-instance list copy (the validator's
+    # list output is coerced to the field type).
+    supported_formats: Tuple[str, ...] = ("pdf", "docx", "txt", "jpg", "png", "pptx", "xlsx", "mp3", "mp4")
     
     # AI Features
     enable_resume_scoring: bool = True
@@ -91,47 +118,69 @@ class Settings(BaseSettings):
     # Dashboard user preference persistence
     preferences_file: str = "data/user_prefs.json"
     # Role defaults
-    default_roles: List[str] = ["user", "admin"]
+    default_roles: Tuple[str, ...] = ("user", "admin")
     default_role: str = "user"
     
-    @validator('supported_formats', pre=True)
+    @field_validator('supported_formats', mode='before')
+    @classmethod
     def parse_supported_formats(cls, v):
         """Parse supported formats from string or list."""
         if isinstance(v, str):
-            if v.lower() == "all":
-                return ["pdf", "docx", "latex", "txt", "jpg", "jpeg", "png", "tiff", "pptx", "ppt", "xlsx", "xls", "mp3", "wav", "m4a", "mp4", "avi"]
-            # Remove any brackets and quotes, then split by comma
-            v = v.strip('[]"\'')
-            return [fmt.strip().strip('"\'') for fmt in v.split(',') if fmt.strip()]
-        elif isinstance(v, list):
+            # Remove any brackets and quotes in one pass, then split by comma
+            v = v.translate(_FORMAT_STRIP_TABLE)
+            if v.strip().lower() == "all":
+                return list(_ALL_FORMATS)
+            return [fmt for fmt in map(str.strip, v.split(',')) if fmt]
+        elif isinstance(v, (list, tuple)):
             return v
         return ["pdf", "docx", "txt"]  # Default fallback
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    # Frozen: the process-wide instance is shared (and memoized by get_settings), so it must not
+    # be mutated; pydantic-core also compiles the validation schema once for the class.
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False, frozen=True)
+
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Process-wide settings, constructed (env/.env read and validated) on first use."""
+    return Settings()
 
-# Global settings instance
-settings = Settings()
+
+def __getattr__(name: str) -> Any:
+    # `settings` stays importable as a module attribute without being built at import time.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ---------------------------------------------------------------------------
 # User Preferences Persistence (simple JSON, no external dependencies)
 # ---------------------------------------------------------------------------
-_PREF_CACHE: Dict[str, Any] = {}
-_PREFS_PATH = Path(settings.preferences_file)
+_PREF_CACHE: Optional[Dict[str, Any]] = None  # None until loaded; {} is a loaded empty store
+_PREFS_PATH: Optional[Path] = None  # resolved from settings on first use
+# Writes only mark the cache dirty; a timer flushes once per burst of changes (and atexit
+# flushes whatever is still pending), so chatty dashboard sessions cost one file write.
+_PREF_FLUSH_DELAY = 0.25
+_PREF_DIRTY = False
+_PREF_TIMER: Optional[threading.Timer] = None
+_PREF_LOCK = threading.Lock()
+
+def _prefs_path() -> Path:
+    global _PREFS_PATH
+    if _PREFS_PATH is None:
+        _PREFS_PATH = Path(get_settings().preferences_file)
+    return _PREFS_PATH
 
 @log_function("DEBUG", "LOAD_USER_PREFS_OK")
 def load_user_preferences() -> Dict[str, Any]:
     """Load user preferences from disk (cached)."""
     global _PREF_CACHE
-    if _PREF_CACHE:
+    if _PREF_CACHE is not None:
         return _PREF_CACHE
     try:
-        if _PREFS_PATH.exists():
-            with _PREFS_PATH.open('r', encoding='utf-8') as f:
-                _PREF_CACHE = json.load(f)
+        path = _prefs_path()
+        if path.exists():
+            _PREF_CACHE = _prefs_loads(path.read_bytes())
         else:
             _PREF_CACHE = {}
     except Exception:
@@ -140,17 +189,55 @@ def load_user_preferences() -> Dict[str, Any]:
 
 @log_function("DEBUG", "SAVE_USER_PREFS_OK")
 def save_user_preferences(prefs: Dict[str, Any]) -> None:
-    """Persist user preferences to disk with atomic write."""
-    global _PREF_CACHE
-    _PREF_CACHE.update(prefs)
-    try:
-        _PREFS_PATH.parent.mkdir(parents=True, exist_ok=True)
-        tmp_path = _PREFS_PATH.with_suffix('.tmp')
-        with tmp_path.open('w', encoding='utf-8') as f:
-            json.dump(_PREF_CACHE, f, indent=2, ensure_ascii=False)
-        tmp_path.replace(_PREFS_PATH)
-    except Exception:
-        pass
+    """Merge preferences into the cache and schedule a (debounced) write to disk."""
+    global _PREF_DIRTY, _PREF_TIMER
+    cache = load_user_preferences()
+    with _PREF_LOCK:
+        cache.update(prefs)
+        _PREF_DIRTY = True
+        if _PREF_TIMER is None:
+            _PREF_TIMER = threading.Timer(_PREF_FLUSH_DELAY, flush_user_preferences)
+            _PREF_TIMER.daemon = True
+            _PREF_TIMER.start()
+
+def flush_user_preferences() -> None:
+    """Write pending preference changes to disk now, with an atomic replace."""
+    global _PREF_DIRTY, _PREF_TIMER
+    with _PREF_LOCK:
+        if _PREF_TIMER is not None:
+            _PREF_TIMER.cancel()
+            _PREF_TIMER = None
+        if not _PREF_DIRTY:
+            return
+        _PREF_DIRTY = False
+        try:
+            path = _prefs_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            tmp_path.write_bytes(_prefs_dumps(_PREF_CACHE))
+            tmp_path.replace(path)
+        except Exception:
+            _PREF_DIRTY = True  # e.g. a concurrent mutation mid-dump; retried on the next flush
+
+def _reset_prefs_after_fork() -> None:
+    # Preloading servers (gunicorn --preload) fork workers after import. A timer thread started
+    # in the parent does not exist in the child, so each worker schedules its own flushes.
+    # Changes pending at fork time stay the parent's to write; the child only flushes its own.
+    global _PREF_DIRTY, _PREF_TIMER, _PREF_LOCK
+    _PREF_DIRTY = False
+    _PREF_TIMER = None
+    _PREF_LOCK = threading.Lock()
+
+atexit.register(flush_user_preferences)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_prefs_after_fork)
+
+def _unchanged(current: Any, value: Any) -> bool:
+    # A container handed back as the cached object itself may have been mutated in place
+    # (get, mutate, set), so it always counts as a change.
+    if current is value and isinstance(value, (dict, list, set)):
+        return False
+    return current == value
 
 @log_function("DEBUG", "GET_USER_PREF_OK")
 def get_user_preference(key: str, default: Any = None) -> Any:
@@ -158,6 +245,9 @@ def get_user_preference(key: str, default: Any = None) -> Any:
 
 @log_function("DEBUG", "SET_USER_PREF_OK")
 def set_user_preference(key: str, value: Any) -> None:
+    prefs = load_user_preferences()
+    if key in prefs and _unchanged(prefs[key], value):
+        return  # idempotent re-apply (e.g. a dashboard re-render): nothing to write
     save_user_preferences({key: value})
 
 # ---------------------------------------------------------------------------
@@ -166,11 +256,12 @@ def set_user_preference(key: str, value: Any) -> None:
 # ---------------------------------------------------------------------------
 @log_function("DEBUG", "ENSURE_USERS_ROOT_OK")
 def _ensure_users_root() -> Dict[str, Any]:
+    # Pure reader: the root is only persisted once a mutating helper saves into it.
     prefs = load_user_preferences()
-    if 'users' not in prefs or not isinstance(prefs['users'], dict):
-        prefs['users'] = {}
-        save_user_preferences({'users': prefs['users']})
-    return prefs['users']
+    users = prefs.get('users')
+    if not isinstance(users, dict):
+        users = prefs['users'] = {}
+    return users
 
 @log_function("DEBUG", "GET_USER_SCOPED_PREF_OK")
 def get_user_scoped_preference(user_id: str, key: str, default: Any = None) -> Any:
@@ -182,32 +273,49 @@ def set_user_scoped_preference(user_id: str, key: str, value: Any) -> None:
     users = _ensure_users_root()
     if user_id not in users or not isinstance(users[user_id], dict):
         users[user_id] = {}
-    users[user_id][key] = value
+    if key == 'roles' and value:
+        value = _normalize_roles(value)
+    entry = users[user_id]
+    if key in entry and _unchanged(entry[key], value):
+        return
+    entry[key] = value
     save_user_preferences({'users': users})
 
 # ---------------------------------------------------------------------------
 # Role-based persistence (simple; production would query DB)
-# Stored as users[user_id]['roles'] = [role1, role2]
+# Stored as users[user_id]['roles'] = (role1, role2); roles are normalized to a tuple of str
+# when written (lists loaded from disk on first read), so lookups return the stored tuple as is.
 # ---------------------------------------------------------------------------
+def _normalize_roles(roles: Any) -> Tuple[str, ...]:
+    if isinstance(roles, (list, tuple)):
+        return tuple(str(r) for r in roles)
+    return (str(roles),)
+
 @log_function("DEBUG", "GET_USER_ROLES_OK")
-def get_user_roles(user_id: str) -> List[str]:
-    users = _ensure_users_root()
-    roles = users.get(user_id, {}).get('roles')
+def get_user_roles(user_id: str) -> Tuple[str, ...]:
+    entry = _ensure_users_root().get(user_id)
+    roles = entry.get('roles') if isinstance(entry, dict) else None
     if not roles:
-        return [settings.default_role]
-    if isinstance(roles, list):
-        return [str(r) for r in roles]
-    return [str(roles)]
+        return (get_settings().default_role,)
+    if not isinstance(roles, tuple):
+        roles = entry['roles'] = _normalize_roles(roles)  # same JSON on disk, so no save needed
+    return roles
 
-@log_function("DEBUG", "ADD_USER_ROLE_OK")
-def add_user_role(user_id: str, role: str) -> None:
+@log_function("DEBUG", "ADD_USER_ROLES_OK")
+def add_user_roles(user_id: str, roles: Iterable[str]) -> None:
+    """Grant several roles with one preferences save (e.g. provisioning at signup)."""
     users = _ensure_users_root()
     entry = users.setdefault(user_id, {})
-    existing = entry.get('roles') or []
-    if role not in existing:
-        entry['roles'] = existing + [role]
+    existing = _normalize_roles(entry['roles']) if entry.get('roles') else ()
+    added = [role for role in dict.fromkeys(map(str, roles)) if role not in existing]
+    if added:
+        entry['roles'] = existing + tuple(added)
         save_user_preferences({'users': users})
 
+@log_function("DEBUG", "ADD_USER_ROLE_OK")
+def add_user_role(user_id: str, role: str) -> None:
+    add_user_roles(user_id, (role,))
+
 @log_function("DEBUG", "HAS_USER_ROLE_OK")
 def user_has_role(user_id: str, role: str) -> bool:
     return role in get_user_roles(user_id)
@@ -217,39 +325,49 @@ def require_role(user_id: str, role: str) -> bool:
     return user_has_role(user_id, role)
 
 
-@log_function("DEBUG", "GET_DB_URL_OK")
+# Settings and the environment do not change during the process lifetime: ENVIRONMENT is read
+# once at import and these getters are memoized (and left uninstrumented: they do no work
+# worth logging). Tests that patch ENVIRONMENT or settings call _refresh_env() afterwards.
+_ENVIRONMENT = os.environ.get("ENVIRONMENT", "")
+_PROD_CORS_ORIGINS: Tuple[str, ...] = (
+    "https://zex-ats-ai.com",
+    "https://app.zex-ats-ai.com",
+    "https://dashboard.zex-ats-ai.com",
+)
+_DEV_CORS_ORIGINS: Tuple[str, ...] = ("*",)  # Allow all origins in development
+
+
+@lru_cache(maxsize=1)
 def get_database_url() -> str:
     """Get database URL with fallback for testing."""
-    if settings.database_url.startswith("sqlite"):
-        return settings.database_url
-    return settings.database_url
+    database_url = get_settings().database_url
+    if database_url.startswith("sqlite"):
+        return database_url
+    return database_url
 
 
-@log_function("DEBUG", "GET_REDIS_URL_OK")
+@lru_cache(maxsize=1)
 def get_redis_url() -> str:
     """Get Redis URL for caching."""
-    return settings.redis_url
+    return get_settings().redis_url
 
 
-@log_function("DEBUG", "IS_PRODUCTION_OK")
+@lru_cache(maxsize=1)
 def is_production() -> bool:
     """Check if running in production mode."""
-    return not settings.debug and os.getenv("ENVIRONMENT") == "production"
+    return not get_settings().debug and _ENVIRONMENT == "production"
 
 
+@lru_cache(maxsize=1)
 @log_function("DEBUG", "GET_CORS_ORIGINS_OK")
-def get_cors_origins() -> List[str]:
-    """Get CORS origins based on environment."""
-    if is_production():
-        return [
-            "https://zex-ats-ai.com",
-            "https://app.zex-ats-ai.com",
-            "https://dashboard.zex-ats-ai.com"
-        ]
-    return ["*"]  # Allow all origins in development
-
-
-@log_function("DEBUG", "GET_SETTINGS_OK")
-def get_settings():
-    """Backward-compatible accessor for settings (unified main expects this)."""
-    return settings
+def get_cors_origins() -> Tuple[str, ...]:
+    """Get CORS origins based on environment (shared immutable tuples)."""
+    return _PROD_CORS_ORIGINS if is_production() else _DEV_CORS_ORIGINS
+
+
+def _refresh_env() -> None:
+    """Re-read ENVIRONMENT and drop the memoized getters so the next calls see current values."""
+    global _ENVIRONMENT
+    _ENVIRONMENT = os.environ.get("ENVIRONMENT", "")
+    for getter in (get_database_url, get_redis_url, is_production, get_cors_origins):
+        getter.cache_clear()
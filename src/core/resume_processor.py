@@ -11,7 +11,7 @@ import asyncio
 from dataclasses import dataclass
 
 import PyPDF2
-import pdfplumber
+import pdfplumber  # provided by pdfplumber-rs (same open/pages/extract_text API, native parser)
 from docx import Document
 from minio import Minio
 
@@ -21,6 +21,47 @@ from src.utils.file_validator import FileValidator
 from src.utils.system_logger import log_function
 
 
+# Extraction patterns, compiled once at import rather than looked up in re's cache per call.
+# Section headers are found in one pass: a known heading at the start of a line (cleaned text
+# often keeps the section's first words on the same line), optionally followed by a colon.
+# ASCII-only matching: Unicode case folding would let e.g. a dotless 'ı' match 'i' and
+# produce a heading missing from _HEADER_TO_SECTION.
+_SECTION_HEADER_RE = re.compile(
+    r'^[ \t]*(summary|profile|objective|experience|work\s+history|employment|education|academic|qualifications'
+    r'|skills|competencies|technologies|projects|portfolio|certifications|certificates|licenses)\b[ \t]*:?',
+    re.IGNORECASE | re.MULTILINE | re.ASCII,
+)
+_HEADER_TO_SECTION = {
+    'summary': 'summary', 'profile': 'summary', 'objective': 'summary',
+    'experience': 'experience', 'work history': 'experience', 'employment': 'experience',
+    'education': 'education', 'academic': 'education', 'qualifications': 'education',
+    'skills': 'skills', 'competencies': 'skills', 'technologies': 'skills',
+    'projects': 'projects', 'portfolio': 'projects',
+    'certifications': 'certifications', 'certificates': 'certifications', 'licenses': 'certifications',
+}
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RES = [re.compile(p) for p in (
+    r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
+    r'\+?\d{1,3}[-.\s]?\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',
+    r'\(\d{3}\)\s?\d{3}-?\d{4}'
+)]
+_LINKEDIN_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r'linkedin\.com/in/[A-Za-z0-9-]+',
+    r'www\.linkedin\.com/in/[A-Za-z0-9-]+',
+    r'https?://(?:www\.)?linkedin\.com/in/[A-Za-z0-9-]+'
+)]
+_GITHUB_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r'github\.com/[A-Za-z0-9-]+',
+    r'www\.github\.com/[A-Za-z0-9-]+',
+    r'https?://(?:www\.)?github\.com/[A-Za-z0-9-]+'
+)]
+_WEBSITE_RE = re.compile(r'https?://[A-Za-z0-9.-]+\.[A-Za-z]{2,}')
+_LOCATION_RES = [re.compile(p) for p in (
+    r'([A-Z][a-z]+,\s*[A-Z]{2})',  # City, State
+    r'([A-Z][a-z]+,\s*[A-Z][a-z]+)',  # City, Country
+)]
+
+
 @dataclass
 class DocumentMetadata:
     """Document metadata information."""
@@ -111,7 +152,7 @@ class ResumeProcessor:
             ProcessedResume object with extracted content and metadata
         """
         import time
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Validate file
         validation_result = await self.file_validator.validate_file(file_content, filename)
@@ -143,11 +184,16 @@ class ResumeProcessor:
         # Extract contact information
         contact_info = await self._extract_contact_info(cleaned_text)
         
+        # Measure the upload by seeking (no copy of the buffer), then reset the file pointer
+        file_content.seek(0, io.SEEK_END)
+        file_size = file_content.tell()
+        file_content.seek(0)
+        
         # Create metadata
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         metadata = DocumentMetadata(
             filename=filename,
-            file_size=len(file_content.read()),
+            file_size=file_size,
             file_type=file_extension,
             page_count=page_count,
             word_count=len(cleaned_text.split()),
@@ -156,9 +202,6 @@ class ResumeProcessor:
             processing_time=processing_time
         )
         
-        # Reset file pointer
-        file_content.seek(0)
-        
         return ProcessedResume(
             text_content=text_content,
             cleaned_text=cleaned_text,
@@ -180,7 +223,7 @@ class ResumeProcessor:
             ProcessedResume object
         """
         import time
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Clean text
         cleaned_text = self.text_cleaner.clean_text(text)
@@ -190,7 +233,7 @@ class ResumeProcessor:
         contact_info = await self._extract_contact_info(cleaned_text)
         
         # Create metadata
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         metadata = DocumentMetadata(
             filename=filename,
             file_size=len(text.encode('utf-8')),
@@ -211,17 +254,18 @@ class ResumeProcessor:
         )
     
     async def _extract_from_pdf(self, file_content: BinaryIO) -> tuple[str, str, int]:
-        """Extract text from PDF file using multiple methods."""
+        """Extract text from PDF file using multiple methods (parsed on a worker thread)."""
+        return await asyncio.to_thread(self._extract_pdf_text, file_content)
+    
+    @staticmethod
+    def _extract_pdf_text(file_content: BinaryIO) -> tuple[str, str, int]:
         file_content.seek(0)
         
         # Try pdfplumber first (better for complex layouts)
         try:
             with pdfplumber.open(file_content) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
+                parts = [page.extract_text() for page in pdf.pages]
+                text = "\n".join(p for p in parts if p is not None)
                 
                 if text.strip():
                     return text, "pdfplumber", len(pdf.pages)
@@ -232,9 +276,8 @@ class ResumeProcessor:
         file_content.seek(0)
         try:
             reader = PyPDF2.PdfReader(file_content)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
+            parts = [page.extract_text() for page in reader.pages]
+            text = "\n".join(p for p in parts if p is not None)
             
             if text.strip():
                 return text, "PyPDF2", len(reader.pages)
@@ -249,18 +292,16 @@ class ResumeProcessor:
         
         try:
             doc = Document(file_content)
-            text = ""
             
             # Extract paragraphs
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
+            parts = [paragraph.text for paragraph in doc.paragraphs]
             
-            # Extract text from tables
+            # Extract text from tables, one line per row
             for table in doc.tables:
                 for row in table.rows:
-                    for cell in row.cells:
-                        text += cell.text + " "
-                    text += "\n"
+                    parts.append(" ".join(cell.text for cell in row.cells))
+            
+            text = "\n".join(parts)
             
             # Estimate page count (roughly 500 words per page)
             word_count = len(text.split())
@@ -291,32 +332,19 @@ class ResumeProcessor:
             raise ValueError("Could not decode text file with any supported encoding")
     
     async def _extract_sections(self, text: str) -> Dict[str, str]:
-        """Extract resume sections using pattern matching."""
-        sections = {}
-        
-        # Define section patterns
-        section_patterns = {
-            'summary': r'(summary|profile|objective)[\s]*:?(.*?)(?=\n\s*(?:experience|education|skills|projects|certifications|\Z))',
-            'experience': r'(experience|work\s+history|employment)[\s]*:?(.*?)(?=\n\s*(?:education|skills|projects|certifications|\Z))',
-            'education': r'(education|academic|qualifications)[\s]*:?(.*?)(?=\n\s*(?:experience|skills|projects|certifications|\Z))',
-            'skills': r'(skills|competencies|technologies)[\s]*:?(.*?)(?=\n\s*(?:experience|education|projects|certifications|\Z))',
-            'projects': r'(projects|portfolio)[\s]*:?(.*?)(?=\n\s*(?:experience|education|skills|certifications|\Z))',
-            'certifications': r'(certifications|certificates|licenses)[\s]*:?(.*?)(?=\n\s*(?:experience|education|skills|projects|\Z))'
-        }
-        
-        text_lower = text.lower()
-        
-        for section_name, pattern in section_patterns.items():
-            match = re.search(pattern, text_lower, re.IGNORECASE | re.DOTALL)
-            if match:
-                # Get the actual text with original case
-                start_pos = match.start(2)
-                end_pos = match.end(2)
-                section_text = text[start_pos:end_pos].strip()
-                if section_text:
-                    sections[section_name] = section_text
-        
-        return sections
+        """Extract resume sections: each header's text runs to the next header, and text under
+        a repeated or synonym header is appended to the section it names."""
+        sections: Dict[str, List[str]] = {}
+        headers = list(_SECTION_HEADER_RE.finditer(text))
+        
+        for header, following in zip(headers, headers[1:] + [None]):
+            section_name = _HEADER_TO_SECTION[' '.join(header.group(1).lower().split())]
+            end_pos = following.start() if following else len(text)
+            section_text = text[header.end():end_pos].strip()
+            if section_text:
+                sections.setdefault(section_name, []).append(section_text)
+        
+        return {name: '\n'.join(parts) for name, parts in sections.items()}
     
     async def _extract_contact_info(self, text: str) -> Dict[str, Optional[str]]:
         """Extract contact information from resume text."""
@@ -330,53 +358,33 @@ class ResumeProcessor:
         }
         
         # Email extraction
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_match = re.search(email_pattern, text)
+        email_match = _EMAIL_RE.search(text)
         if email_match:
             contact_info['email'] = email_match.group()
         
         # Phone extraction
-        phone_patterns = [
-            r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-            r'\+?\d{1,3}[-.\s]?\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',
-            r'\(\d{3}\)\s?\d{3}-?\d{4}'
-        ]
-        
-        for pattern in phone_patterns:
-            phone_match = re.search(pattern, text)
+        for pattern in _PHONE_RES:
+            phone_match = pattern.search(text)
             if phone_match:
                 contact_info['phone'] = phone_match.group().strip()
                 break
         
         # LinkedIn extraction
-        linkedin_patterns = [
-            r'linkedin\.com/in/[A-Za-z0-9-]+',
-            r'www\.linkedin\.com/in/[A-Za-z0-9-]+',
-            r'https?://(?:www\.)?linkedin\.com/in/[A-Za-z0-9-]+'
-        ]
-        
-        for pattern in linkedin_patterns:
-            linkedin_match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _LINKEDIN_RES:
+            linkedin_match = pattern.search(text)
             if linkedin_match:
                 contact_info['linkedin'] = linkedin_match.group()
                 break
         
         # GitHub extraction
-        github_patterns = [
-            r'github\.com/[A-Za-z0-9-]+',
-            r'www\.github\.com/[A-Za-z0-9-]+',
-            r'https?://(?:www\.)?github\.com/[A-Za-z0-9-]+'
-        ]
-        
-        for pattern in github_patterns:
-            github_match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _GITHUB_RES:
+            github_match = pattern.search(text)
             if github_match:
                 contact_info['github'] = github_match.group()
                 break
         
         # Website extraction
-        website_pattern = r'https?://[A-Za-z0-9.-]+\.[A-Za-z]{2,}'
-        website_matches = re.findall(website_pattern, text)
+        website_matches = _WEBSITE_RE.findall(text)
         if website_matches:
             # Filter out LinkedIn and GitHub URLs
             websites = [url for url in website_matches 
@@ -385,13 +393,8 @@ class ResumeProcessor:
                 contact_info['website'] = websites[0]
         
         # Location extraction (basic patterns)
-        location_patterns = [
-            r'([A-Z][a-z]+,\s*[A-Z]{2})',  # City, State
-            r'([A-Z][a-z]+,\s*[A-Z][a-z]+)',  # City, Country
-        ]
-        
-        for pattern in location_patterns:
-            location_match = re.search(pattern, text)
+        for pattern in _LOCATION_RES:
+            location_match = pattern.search(text)
             if location_match:
                 contact_info['location'] = location_match.group(1)
                 break
@@ -401,8 +404,8 @@ class ResumeProcessor:
     async def _store_file(self, file_content: BinaryIO, filename: str) -> str:
         """Store file in MinIO object storage."""
         try:
-            file_content.seek(0)
-            file_size = len(file_content.read())
+            file_content.seek(0, io.SEEK_END)
+            file_size = file_content.tell()
             file_content.seek(0)
             
             # Generate unique filename
@@ -54,12 +54,19 @@ except ImportError:
     st.error("Unable to import required modules. Please ensure the application is properly installed.")
     st.stop()
 
+@st.cache_resource
+def _shared_ats_analyzer() -> ATSAnalyzer:
+    """One analyzer per server process: Streamlit re-runs this script on every interaction,
+    and a fresh instance would reload spaCy and start with an empty result cache."""
+    return ATSAnalyzer()
+
+
 class StreamlitDashboard:
     """Streamlit dashboard for ZeX-ATS-AI."""
     
     def __init__(self):
         """Initialize dashboard components."""
-        self.ats_analyzer = ATSAnalyzer()
+        self.ats_analyzer = _shared_ats_analyzer()
         self.resume_processor = ResumeProcessor()
         # Session defaults
         prefs = load_user_preferences()
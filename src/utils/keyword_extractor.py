@@ -8,6 +8,8 @@ environments.
 """
 
 import re
+import asyncio
+import threading
 from typing import List, Dict, Set, Optional, Tuple
 from collections import Counter, defaultdict
 
@@ -34,28 +36,31 @@ try:
 except Exception:  # pragma: no cover
     requests = None  # type: ignore
 
-from src.core.config import settings
 from src.utils.system_logger import log_function
 
+# Compiled once at import; the extractors below run on every analysis
+_PROG_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\b(python|java|javascript|typescript|c\+\+|c#)\b',
+    r'\b(sql|mysql|postgresql|mongodb)\b',
+    r'\b(react|angular|vue)\b',
+    r'\b(aws|azure|gcp)\b',
+))
+_ACRONYM_RE = re.compile(r'\b[A-Z]{2,5}\b')
+_METRIC_RES = (re.compile(r'(\d+(?:\.\d+)?)\s*%'), re.compile(r'\$(\d+(?:,\d{3})*(?:\.\d{2})?)'))
+_REQUIRED_RE = re.compile(r'(required|must have|essential)(.*?)(preferred|nice to have|plus|bonus|$)', re.DOTALL)
+_PREFERRED_RE = re.compile(r'(preferred|nice to have|plus|bonus)(.*)$', re.DOTALL)
+_EXP_LEVEL_RES = (re.compile(r'(\d+)\+?\s*years?'), re.compile(r'(entry|junior|senior|lead|principal|staff)'))
+_EDU_RES = (re.compile(r'(bachelor|master|phd|doctorate|associate)'), re.compile(r'(bs|ba|ms|ma|mba|phd)'))
+
 
 class KeywordExtractor:
     """Advanced keyword extraction for resume and job description analysis (with graceful fallback)."""
 
     def __init__(self):
-        # spaCy model (optional)
-        self.nlp = None
-        if spacy:
-            for model in ["en_core_web_lg", "en_core_web_sm"]:
-                try:
-                    self.nlp = spacy.load(model)  # type: ignore
-                    break
-                except Exception:
-                    continue
-            if self.nlp is None:
-                try:
-                    self.nlp = spacy.blank("en")  # type: ignore
-                except Exception:
-                    pass
+        # spaCy model (optional), loaded on first use (see ``nlp``)
+        self._nlp = None
+        self._nlp_loaded = False
+        self._nlp_lock = threading.Lock()
         # TF-IDF (optional)
         if TfidfVectorizer:
             self.tfidf = TfidfVectorizer(
@@ -91,6 +96,40 @@ class KeywordExtractor:
         self.all_stop_words = sw.union(self.resume_stop_words)
 
     # ------------------------------ Loaders ---------------------------------
+    @property
+    def nlp(self):
+        """spaCy pipeline (None when unavailable), loaded on first access."""
+        if not self._nlp_loaded:
+            with self._nlp_lock:
+                if not self._nlp_loaded:
+                    self._nlp = self._load_nlp()
+                    self._nlp_loaded = True
+        return self._nlp
+
+    @nlp.setter
+    def nlp(self, value):
+        self._nlp, self._nlp_loaded = value, True
+
+    async def _nlp_async(self):
+        """``nlp`` without blocking the event loop on the first (model-loading) access."""
+        return self._nlp if self._nlp_loaded else await asyncio.to_thread(lambda: self.nlp)
+
+    @staticmethod
+    def _load_nlp():
+        if not spacy:
+            return None
+        # Small model first (vectors unused). NER feeds the ORG/PRODUCT keywords and the
+        # parser feeds noun_chunks, so the full pipeline stays enabled.
+        for model in ["en_core_web_sm", "en_core_web_lg"]:
+            try:
+                return spacy.load(model)  # type: ignore
+            except Exception:
+                continue
+        try:
+            return spacy.blank("en")  # type: ignore
+        except Exception:
+            return None
+
     def _load_technical_skills(self) -> Dict[str, List[str]]:
         return {
             'programming_languages': ['python','java','javascript','typescript','c++','c#','go','rust','swift','kotlin','scala','r','php','ruby'],
@@ -114,16 +153,30 @@ class KeywordExtractor:
 
     # --------------------------- Public Methods -----------------------------
     @log_function("INFO", "KW_EXTRACT_OK")
-    async def extract_keywords(self, text: str, method: str = 'hybrid', top_n: int = 50) -> List[str]:
+    async def extract_keywords(self, text: str, method: str = 'hybrid', top_n: int = 50, doc=None) -> List[str]:
         if not text.strip():
             return []
         if method == 'tfidf':
             return await self._extract_tfidf_keywords(text, top_n)
         if method == 'spacy':
-            return await self._extract_spacy_keywords(text, top_n)
+            return await self._extract_spacy_keywords(text, top_n, doc)
         if method == 'pattern':
             return await self._extract_pattern_keywords(text, top_n)
-        return await self._extract_hybrid_keywords(text, top_n)
+        return await self._extract_hybrid_keywords(text, top_n, doc)
+
+    async def extract_keywords_batch(self, texts: List[str], method: str = 'hybrid', top_n: int = 50) -> List[List[str]]:
+        """``extract_keywords`` for several texts; spaCy-backed methods parse them in one ``nlp.pipe`` call."""
+        docs: List[Optional[object]] = [None] * len(texts)
+        if method in ('hybrid', 'spacy') and await self._nlp_async():
+            live = [i for i, text in enumerate(texts) if text.strip()]
+            try:
+                # Off the event loop, like ATSAnalyzer's own parse: the tagger/parser pass is the heavy step
+                parsed = await asyncio.to_thread(lambda: list(self.nlp.pipe([texts[i] for i in live])))
+                for i, doc in zip(live, parsed):
+                    docs[i] = doc
+            except Exception:
+                pass  # each text falls back to its own parse (and error handling) below
+        return [await self.extract_keywords(text, method, top_n, doc) for text, doc in zip(texts, docs)]
 
     async def _extract_tfidf_keywords(self, text: str, top_n: int) -> List[str]:
         if not self.tfidf:
@@ -137,11 +190,11 @@ class KeywordExtractor:
         except Exception:
             return await self._extract_pattern_keywords(text, top_n)
 
-    async def _extract_spacy_keywords(self, text: str, top_n: int) -> List[str]:
-        if not self.nlp:
+    async def _extract_spacy_keywords(self, text: str, top_n: int, doc=None) -> List[str]:
+        if not await self._nlp_async():
             return await self._extract_pattern_keywords(text, top_n)
         try:
-            doc = self.nlp(text)
+            doc = doc if doc is not None else await asyncio.to_thread(self.nlp, text)
             kws = []
             for ent in getattr(doc, 'ents', []):
                 if ent.label_ in ['ORG','PRODUCT','TECHNOLOGY']:
@@ -167,30 +220,24 @@ class KeywordExtractor:
         for s in self.soft_skills:
             if s in text_lower:
                 kws.append(s)
-        prog_patterns = [
-            r'\b(python|java|javascript|typescript|c\+\+|c#)\b',
-            r'\b(sql|mysql|postgresql|mongodb)\b',
-            r'\b(react|angular|vue)\b',
-            r'\b(aws|azure|gcp)\b'
-        ]
-        for p in prog_patterns:
-            for m in re.findall(p, text_lower, re.IGNORECASE):
+        for p in _PROG_RES:
+            for m in p.findall(text_lower):
                 if isinstance(m, tuple):
                     for part in m:
                         if part:
                             kws.append(part.lower())
                 else:
                     kws.append(m.lower())
-        acronyms = re.findall(r'\b[A-Z]{2,5}\b', text)
+        acronyms = _ACRONYM_RE.findall(text)
         kws.extend([a.lower() for a in acronyms])
         counts = Counter(kws)
         return [k for k,_ in counts.most_common(top_n)]
 
-    async def _extract_hybrid_keywords(self, text: str, top_n: int) -> List[str]:
+    async def _extract_hybrid_keywords(self, text: str, top_n: int, doc=None) -> List[str]:
         part = max(5, top_n // 3)
         combined = (
             await self._extract_tfidf_keywords(text, part) +
-            await self._extract_spacy_keywords(text, part) +
+            await self._extract_spacy_keywords(text, part, doc) +
             await self._extract_pattern_keywords(text, part)
         )
         counts = Counter(combined)
@@ -228,9 +275,8 @@ class KeywordExtractor:
         for v in verbs:
             if v in tl:
                 out['action_verbs'].append(v)
-        metric_patterns = [r'(\d+(?:\.\d+)?)\s*%', r'\$(\d+(?:,\d{3})*(?:\.\d{2})?)']
-        for p in metric_patterns:
-            for m in re.findall(p, tl):
+        for p in _METRIC_RES:
+            for m in p.findall(tl):
                 out['metrics'].append(m if isinstance(m, str) else ' '.join(m))
         return out
 
@@ -240,20 +286,18 @@ class KeywordExtractor:
         req = {'required_skills': [], 'preferred_skills': [], 'experience_level': [], 'education': [], 'certifications': []}
         text_lower = job_description.lower()
         # Simple segmentation
-        required_match = re.search(r'(required|must have|essential)(.*?)(preferred|nice to have|plus|bonus|$)', text_lower, re.DOTALL)
+        required_match = _REQUIRED_RE.search(text_lower)
         if required_match:
             segment = required_match.group(2)
             req['required_skills'] = [w for w in set(segment.split()) if len(w) > 4][:20]
-        preferred_match = re.search(r'(preferred|nice to have|plus|bonus)(.*)$', text_lower, re.DOTALL)
+        preferred_match = _PREFERRED_RE.search(text_lower)
         if preferred_match:
             seg = preferred_match.group(2)
             req['preferred_skills'] = [w for w in set(seg.split()) if len(w) > 4][:15]
-        exp_patterns = [r'(\d+)\+?\s*years?', r'(entry|junior|senior|lead|principal|staff)']
-        for p in exp_patterns:
-            req['experience_level'].extend([m if isinstance(m, str) else ' '.join(m) for m in re.findall(p, text_lower)])
-        edu_patterns = [r'(bachelor|master|phd|doctorate|associate)', r'(bs|ba|ms|ma|mba|phd)']
-        for p in edu_patterns:
-            req['education'].extend([m if isinstance(m, str) else ' '.join(m) for m in re.findall(p, text_lower)])
+        for p in _EXP_LEVEL_RES:
+            req['experience_level'].extend([m if isinstance(m, str) else ' '.join(m) for m in p.findall(text_lower)])
+        for p in _EDU_RES:
+            req['education'].extend([m if isinstance(m, str) else ' '.join(m) for m in p.findall(text_lower)])
         return req
 
     @log_function("DEBUG", "GENERIC_KW_OK")
@@ -16,7 +16,7 @@ import sys
 import functools
 import inspect
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta
 from time import perf_counter
 from typing import Any, Callable, Dict
 
@@ -172,15 +172,41 @@ def _format_params(bound_args: inspect.BoundArguments) -> str:
     return joined if len(joined) <= 400 else joined[:397] + "..."
 
 
+def _log_filtered_failure(fn: Callable, args: tuple, kwargs: dict, start_perf: float, caller_fn: str, error: Exception) -> None:
+    """ERROR event for a call whose own level was filtered out (parameters are formatted only now)."""
+    if not _base_logger.isEnabledFor(logging.ERROR):
+        return
+    latency = (perf_counter() - start_perf) * 1000
+    end_dt = datetime.utcnow()
+    try:
+        bound = inspect.signature(fn).bind(*args, **kwargs)
+        bound.apply_defaults()
+        params = _format_params(bound)
+    except TypeError:  # pragma: no cover - the call itself failed to bind
+        params = "-"
+    log_function_event("ERROR", fn.__name__, params, end_dt - timedelta(milliseconds=latency), end_dt, latency,
+                       caller_fn, f"{fn.__module__}.{fn.__name__}", "-", None, str(error))
+
+
 def log_function(log_type: str = "DEBUG", success_remark: str | None = "SUCCESS") -> Callable:
     """Decorator to log function start/end with latency & outcome.
-    Supports sync & async functions.
+    Supports sync & async functions. When the logger filters out ``log_type`` the call runs
+    with only a level check, and only failures are still reported.
     """
     def decorator(fn: Callable) -> Callable:
         is_coro = asyncio.iscoroutinefunction(fn)
+        level = _map_level(log_type.upper())
 
         @functools.wraps(fn)
         def _sync_wrapper(*args, **kwargs):
+            if not _base_logger.isEnabledFor(level):
+                # Level filtered out: skip signature binding and stack capture; failures still log.
+                start_perf = perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                except Exception as e:  # noqa: BLE001
+                    _log_filtered_failure(fn, args, kwargs, start_perf, inspect.stack()[1].function, e)
+                    raise
             start_perf = perf_counter()
             start_dt = datetime.utcnow()
             sig = inspect.signature(fn)
@@ -203,6 +229,13 @@ def log_function(log_type: str = "DEBUG", success_remark: str | None = "SUCCESS"
 
         @functools.wraps(fn)
         async def _async_wrapper(*args, **kwargs):
+            if not _base_logger.isEnabledFor(level):
+                start_perf = perf_counter()
+                try:
+                    return await fn(*args, **kwargs)
+                except Exception as e:  # noqa: BLE001
+                    _log_filtered_failure(fn, args, kwargs, start_perf, inspect.stack()[1].function, e)
+                    raise
             start_perf = perf_counter()
             start_dt = datetime.utcnow()
             sig = inspect.signature(fn)
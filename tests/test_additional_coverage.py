@@ -8,7 +8,7 @@ def test_readability_fallback_exception(monkeypatch):
     # Force flesch_reading_ease to raise to exercise except path returning 0.7 neutral
     monkeypatch.setattr(analyzer_mod, 'flesch_reading_ease', lambda _t: (_ for _ in ()).throw(RuntimeError('boom')))  # generator trick to raise
     a = analyzer_mod.ATSAnalyzer()
-    val = a._calculate_readability_score("Some arbitrary text for readability scoring")  # noqa: SLF001
+    val = a._score_all(analyzer_mod._Ctx.build("Some arbitrary text for readability scoring"))[1]  # noqa: SLF001
     assert val == 0.7
 
 
@@ -0,0 +1,118 @@
+import asyncio
+import importlib
+import io
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+# Collaborators of the analyze router that are not part of this tree
+_ABSENT = {
+    "src.core.security": {"get_current_user": lambda: None},
+    "src.models.user": {"User": object},
+    "src.services.analysis_service": {"AnalysisService": object},
+    "src.utils.validators": {"validate_file_size": None, "validate_file_type": None},
+    "src.ai.processors.enhanced_document_processor": {"EnhancedDocumentProcessor": object},
+}
+
+
+class FakeProcessor:
+    def __init__(self):
+        self.calls = []
+
+    def describe_file(self, filename, content_type, size):
+        fmt = Path(filename).suffix.lower().lstrip(".")
+        if fmt not in ("pdf", "docx", "txt"):
+            raise ValueError(f"Unsupported file format: {fmt}")
+        return {"filename": filename, "format": fmt, "mime_type": content_type, "size": size}
+
+    async def process_staged_file(self, path, file_info, analysis_type):
+        self.calls.append((Path(path).read_bytes(), file_info["format"], analysis_type))
+        await asyncio.sleep(0)
+        score = {"resume": 70, "job_description": 40}.get(analysis_type, 10)
+        return {
+            "success": True,
+            "file_info": {"format": file_info["format"]},
+            "content": {"text": "x" * file_info["size"]},
+            "insights": {"ats_score": score},
+        }
+
+
+class FakeUpload:
+    def __init__(self, filename, data):
+        self.filename = filename
+        self.content_type = None
+        self._buf = io.BytesIO(data)
+
+    async def read(self, size=-1):
+        return self._buf.read(size)
+
+
+@pytest.fixture
+def analyze(monkeypatch):
+    for name, attrs in _ABSENT.items():
+        if name not in sys.modules:
+            monkeypatch.setitem(sys.modules, name, types.SimpleNamespace(**attrs))
+    monkeypatch.delitem(sys.modules, "src.api.v1.analyze", raising=False)
+    module = importlib.import_module("src.api.v1.analyze")
+    monkeypatch.setattr(module, "document_processor", FakeProcessor())
+
+    async def _allow(*_args):
+        return True
+
+    monkeypatch.setattr(module.rate_limiter, "check_concurrent_analyses", _allow)
+    module._STAGED_RESULT_CACHE.clear()
+    return module
+
+
+def _user():
+    return types.SimpleNamespace(id=1, subscription_tier=types.SimpleNamespace(value="enterprise"))
+
+
+def test_stage_spools_hashes_and_sizes(analyze):
+    import hashlib
+
+    path, sha, size = asyncio.run(analyze._stage(FakeUpload("cv.pdf", b"abc" * 1000)))
+    try:
+        assert Path(path).read_bytes() == b"abc" * 1000 and path.endswith(".pdf")
+        assert (sha, size) == (hashlib.sha256(b"abc" * 1000).hexdigest(), 3000)
+    finally:
+        Path(path).unlink()
+
+
+def test_cache_hits_only_for_same_format_and_analysis_type(analyze, tmp_path):
+    staged = tmp_path / "doc"
+    staged.write_bytes(b"same bytes")
+    processor = analyze.document_processor
+
+    def run(name, analysis_type):
+        upload = FakeUpload(name, b"")
+        return asyncio.run(analyze.process_single_file_async(upload, analysis_type, _user(), str(staged), "sha", 10))
+
+    first = run("a.pdf", "resume")
+    again = run("b.pdf", "resume")
+    assert again == {**first, "filename": "b.pdf"} and len(processor.calls) == 1
+
+    as_jd = run("a.pdf", "job_description")
+    as_txt = run("a.txt", "resume")
+    assert len(processor.calls) == 3
+    assert (first["ats_score"], as_jd["ats_score"]) == (70, 40)
+    assert (first["format"], as_txt["format"]) == ("pdf", "txt")
+
+
+def test_batch_dedups_identical_uploads_per_format(analyze):
+    files = [
+        FakeUpload("one.pdf", b"resume"),
+        FakeUpload("two.pdf", b"resume"),
+        FakeUpload("three.txt", b"resume"),
+        FakeUpload("four.exe", b"resume"),
+    ]
+    response = asyncio.run(analyze.batch_process_documents(files=files, analysis_type="resume", current_user=_user()))
+    results = {r["filename"]: r for r in response["results"]}
+    assert sorted(analyze.document_processor.calls) == [(b"resume", "pdf", "resume"), (b"resume", "txt", "resume")]
+    assert results["one.pdf"]["format"] == results["two.pdf"]["format"] == "pdf"
+    assert results["three.txt"]["format"] == "txt"
+    assert not results["four.exe"]["success"]
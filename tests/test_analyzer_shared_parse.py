@@ -0,0 +1,443 @@
+import asyncio
+import types
+
+import pytest
+
+from src.core.ats_analyzer import ATSAnalyzer, _Ctx
+
+RESUME = """Jane Roe\nExperience\nAchieved 30% faster builds. Implemented Python services.\nEducation\nBachelor of Science\nSkills\nPython AWS Docker"""
+
+
+class FakeToken:
+    def __init__(self, text, pos='VERB'):
+        self.text = text
+        self.lemma_ = text.lower()
+        self.pos_ = pos
+        self.is_alpha = text.isalpha()
+
+
+class FakeDoc(list):
+    @property
+    def sents(self):
+        return [types.SimpleNamespace(text=RESUME)]
+
+
+class CountingNLP:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, _text):
+        self.calls += 1
+        return FakeDoc([FakeToken('Achieve'), FakeToken('Implement'), FakeToken('Python', 'NOUN')])
+
+
+def fake_nlp_analyzer(nlp):
+    analyzer = ATSAnalyzer()
+    analyzer.nlp = nlp
+    analyzer.nlp_mode = 'fake'
+    analyzer._skill_matcher = None  # noqa: SLF001 - fake docs are not spaCy Docs
+    return analyzer
+
+
+def test_analyze_resume_parses_once():
+    analyzer = fake_nlp_analyzer(CountingNLP())
+    result = asyncio.run(analyzer.analyze_resume(RESUME))
+    assert result.content_analysis['nlp_mode'] == 'fake'
+    # Insights reuse the gathered analyses, so the whole pipeline parses exactly once.
+    assert analyzer.nlp.calls == 1
+    assert 'insights' in result.ai_insights
+
+
+def test_parse_failure_returns_none():
+    analyzer = ATSAnalyzer()
+
+    def boom(_text):
+        raise RuntimeError('parse failure')
+
+    analyzer.nlp = boom
+    assert analyzer._parse(RESUME) is None  # noqa: SLF001
+    analyzer.nlp = None
+    assert analyzer._parse(RESUME) is None  # noqa: SLF001
+
+
+class PipeNLP(CountingNLP):
+    def __init__(self, fail=False):
+        super().__init__()
+        self.fail = fail
+        self.batches = []
+
+    def pipe(self, texts, batch_size=64, n_process=1):
+        if self.fail:
+            raise RuntimeError('pipe failure')
+        self.batches.append((len(texts), batch_size, n_process))
+        return [self(t) for t in texts]
+
+
+def test_analyze_batch_uses_single_pipe_call():
+    analyzer = fake_nlp_analyzer(PipeNLP())
+    results = asyncio.run(analyzer.analyze_batch([RESUME, "Intern"], ["Python AWS", None], batch_size=8))
+    assert len(results) == 2
+    assert analyzer.nlp.batches == [(2, 8, 1)]
+    single = asyncio.run(analyzer.analyze_resume(RESUME, "Python AWS"))
+    assert results[0].ats_score == single.ats_score
+
+
+def test_analyze_batch_fallbacks():
+    analyzer = ATSAnalyzer()
+    analyzer.nlp = PipeNLP(fail=True)
+    assert len(analyzer._parse_many([RESUME, RESUME])) == 2  # noqa: SLF001
+    analyzer.nlp = CountingNLP()
+    assert len(analyzer._parse_many([RESUME])) == 1  # noqa: SLF001
+    analyzer.nlp = None
+    assert analyzer._parse_many([RESUME]) == [None]  # noqa: SLF001
+    with pytest.raises(ValueError):
+        asyncio.run(analyzer.analyze_batch([RESUME], []))
+
+
+def test_content_score_counts_inflected_verbs_without_spacy():
+    analyzer = ATSAnalyzer()
+
+    def forbidden(_text):
+        raise AssertionError('content score must not parse')
+
+    analyzer.nlp = forbidden
+    base = analyzer._score_all(_Ctx.build("Python team"))[2]  # noqa: SLF001
+    verbs = analyzer._score_all(_Ctx.build("Python team achieved and implemented"))[2]  # noqa: SLF001
+    assert round(verbs - base, 3) == 0.2
+
+
+def test_flesch_computed_once_per_context(monkeypatch):
+    from src.core import ats_analyzer as analyzer_mod
+
+    calls = []
+    monkeypatch.setattr(analyzer_mod, 'flesch_reading_ease', lambda t: calls.append(t) or 70.0)
+    analyzer = ATSAnalyzer()
+    ctx = analyzer_mod._Ctx.build(RESUME)  # noqa: SLF001
+    score = asyncio.run(analyzer._analyze_ats_compatibility(RESUME, None, ctx))  # noqa: SLF001
+    content = asyncio.run(analyzer._analyze_content_quality(RESUME, ctx))  # noqa: SLF001
+    assert score.readability_score == 100.0 and content['readability_score'] == 70.0
+    assert calls == [RESUME]
+
+
+def test_parse_runs_off_the_event_loop_thread():
+    import threading
+
+    seen = []
+
+    class ThreadRecordingNLP(CountingNLP):
+        def __call__(self, text):
+            seen.append(threading.get_ident())
+            return super().__call__(text)
+
+    analyzer = fake_nlp_analyzer(ThreadRecordingNLP())
+    asyncio.run(analyzer.analyze_resume(RESUME))
+    assert seen and threading.get_ident() not in seen
+
+
+def test_batch_score_matches_single_scores():
+    analyzer = ATSAnalyzer()
+    resumes = [RESUME, "Intern", ""]
+    batch = asyncio.run(analyzer.batch_score(resumes, ["Python AWS", None, None]))
+    singles = [asyncio.run(analyzer._analyze_ats_compatibility(r, jd))  # noqa: SLF001
+               for r, jd in zip(resumes, ["Python AWS", None, None])]
+    assert batch == singles
+    assert asyncio.run(analyzer.batch_score([])) == []
+    with pytest.raises(ValueError):
+        asyncio.run(analyzer.batch_score([RESUME], []))
+
+
+def test_keywords_extracted_once_per_context():
+    analyzer = ATSAnalyzer()
+    extract = analyzer.keyword_extractor.extract_keywords
+    calls = []
+
+    async def counting(text, *args, **kwargs):
+        calls.append(text)
+        return await extract(text, *args, **kwargs)
+
+    analyzer.keyword_extractor.extract_keywords = counting
+    ctx = _Ctx.build(RESUME)
+    score = asyncio.run(analyzer._calculate_keyword_score(RESUME, "Python AWS", ctx))  # noqa: SLF001
+    analysis = asyncio.run(analyzer._analyze_keywords(RESUME, "Python AWS", ctx))  # noqa: SLF001
+    assert sorted(calls) == sorted([RESUME, "Python AWS"])
+    assert score == min(len(analysis['matched_keywords']) / len(ctx.job_keywords), 1.0)
+
+
+def test_skills_use_phrase_matcher_when_doc_available():
+
+    class Span:
+        def __init__(self, text):
+            self.text = text
+
+    class SpanDoc(list):
+        def __getitem__(self, item):
+            if isinstance(item, slice):
+                return Span(" ".join(list.__getitem__(self, item)))
+            return list.__getitem__(self, item)
+
+    doc = SpanDoc(["Python", "Leadership", "AWS"])
+    analyzer = ATSAnalyzer()
+    analyzer._skill_matcher = lambda _doc: [(1, 0, 1), (2, 1, 2), (1, 2, 3)]  # noqa: SLF001
+    analyzer._soft_match_id = 2  # noqa: SLF001
+    result = asyncio.run(analyzer._analyze_skills("ignored", _Ctx.build("Python Leadership AWS", doc)))  # noqa: SLF001
+    assert sorted(result['technical_skills']) == ['AWS', 'Python']
+    assert result['soft_skills'] == ['leadership']
+    assert result['skills_by_category']['cloud'] == ['AWS']
+
+
+def test_failing_readability_does_not_abort_analysis(monkeypatch):
+    from src.core import ats_analyzer as analyzer_mod
+
+    def boom(_text):
+        raise ZeroDivisionError('no sentences')
+
+    monkeypatch.setattr(analyzer_mod, 'flesch_reading_ease', boom)
+    result = asyncio.run(ATSAnalyzer().analyze_resume("   "))
+    assert result.ats_score.readability_score == 70.0
+    assert result.content_analysis['readability_score'] == analyzer_mod._NEUTRAL_FLESCH  # noqa: SLF001
+    assert result.keyword_analysis['keyword_density'] == 0.0
+
+
+def test_analyze_resume_memoizes_by_content(monkeypatch):
+    from src.core import ats_analyzer as analyzer_mod
+
+    analyzer = ATSAnalyzer()
+    runs = []
+    original = analyzer._analyze_parsed  # noqa: SLF001
+
+    async def counting(*args):
+        runs.append(args[0])
+        return await original(*args)
+
+    analyzer._analyze_parsed = counting  # noqa: SLF001
+    first = asyncio.run(analyzer.analyze_resume(RESUME, "Python AWS"))
+    first.strengths.append("mutated by caller")
+    second = asyncio.run(analyzer.analyze_resume(RESUME, "Python AWS"))
+    assert runs == [RESUME]
+    assert "mutated by caller" not in second.strengths
+    assert second.ats_score == first.ats_score
+
+    asyncio.run(analyzer.analyze_resume(RESUME, "Python AWS", target_role="SRE"))
+    batch = asyncio.run(analyzer.analyze_batch([RESUME, "Intern"], ["Python AWS", None]))
+    assert runs == [RESUME, RESUME, "Intern"]
+    assert batch[0].ats_score == first.ats_score
+
+    monkeypatch.setattr(analyzer_mod, '_RESULT_CACHE_SIZE', 1)
+    monkeypatch.setattr(analyzer_mod, '_RESULT_CACHE_TTL', -1.0)
+    asyncio.run(analyzer.analyze_resume("Graduate"))
+    assert len(analyzer._result_cache) == 1  # noqa: SLF001
+    asyncio.run(analyzer.analyze_resume("Graduate"))
+    assert runs[-2:] == ["Graduate", "Graduate"]
+
+
+def test_to_json_matches_to_dict():
+    import json
+
+    result = asyncio.run(ATSAnalyzer().analyze_resume(RESUME, "Python AWS"))
+    assert json.loads(result.to_json()) == json.loads(json.dumps(result.to_dict()))
+    from dataclasses import asdict
+    assert result.ats_score.to_dict() == asdict(result.ats_score)
+
+
+def test_experience_counts_date_matches_up_to_three():
+    analyzer = ATSAnalyzer()
+
+    def experience(text):
+        return analyzer._score_all(_Ctx.build(text))[5]  # noqa: SLF001
+
+    none = experience("Team player")
+    one = experience("Team player 2019-2020")
+    assert round(one - none, 3) == round(0.4 / 3, 3)
+    three = experience("2015-2016, 2017 – 2018 and Jan 2020")
+    assert round(three - none, 3) == 0.4
+    assert experience("2015-2016, 2017-2018, 2019/2020, March 2021") == three
+
+
+def test_concurrent_identical_requests_share_one_analysis():
+    analyzer = ATSAnalyzer()
+    runs = []
+    original = analyzer._analyze_parsed  # noqa: SLF001
+
+    async def counting(*args):
+        runs.append(args[0])
+        await asyncio.sleep(0)
+        return await original(*args)
+
+    analyzer._analyze_parsed = counting  # noqa: SLF001
+
+    async def burst():
+        return await asyncio.gather(*(analyzer.analyze_resume(RESUME, "Python AWS") for _ in range(4)))
+
+    results = asyncio.run(burst())
+    assert runs == [RESUME]
+    assert len({id(r) for r in results}) == 4
+    assert all(r.ats_score == results[0].ats_score for r in results)
+    assert analyzer._inflight == {}  # noqa: SLF001
+
+
+def test_keyword_batch_parses_texts_in_one_pipe_call():
+    from src.utils.keyword_extractor import KeywordExtractor
+
+    extractor = KeywordExtractor()
+    extractor.nlp = PipeNLP()
+    out = asyncio.run(extractor.extract_keywords_batch([RESUME, "", "Python AWS"]))
+    assert extractor.nlp.batches == [(2, 64, 1)] and extractor.nlp.calls == 2
+    assert out[1] == [] and 'python' in out[2]
+
+    extractor.nlp = PipeNLP(fail=True)
+    assert asyncio.run(extractor.extract_keywords_batch([RESUME, "Python AWS"]))[1] == out[2]
+    assert extractor.nlp.calls == 2
+
+
+def test_shared_analyzer_does_not_coalesce_across_event_loops():
+    import threading
+
+    analyzer = ATSAnalyzer()
+    original = analyzer._analyze_parsed  # noqa: SLF001
+    both_in_flight = threading.Barrier(2, timeout=5)
+
+    async def rendezvous(*args):
+        both_in_flight.wait()
+        return await original(*args)
+
+    analyzer._analyze_parsed = rendezvous  # noqa: SLF001
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(asyncio.run(analyzer.analyze_resume(RESUME))))
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 2 and results[0].ats_score == results[1].ats_score
+    assert analyzer._inflight == {}  # noqa: SLF001
+
+
+def test_keyword_extractor_parses_off_the_event_loop_thread():
+    import threading
+    from src.utils.keyword_extractor import KeywordExtractor
+
+    class ThreadRecordingNLP(PipeNLP):
+        def __call__(self, text):
+            self.threads.append(threading.get_ident())
+            return super().__call__(text)
+
+    extractor = KeywordExtractor()
+    extractor.nlp = ThreadRecordingNLP()
+    extractor.nlp.threads = []
+    asyncio.run(extractor.extract_keywords(RESUME, method='spacy'))
+    asyncio.run(extractor.extract_keywords_batch([RESUME, "Python AWS"]))
+    assert len(extractor.nlp.threads) == 3 and threading.get_ident() not in extractor.nlp.threads
+
+
+def test_keywords_memoized_across_analyses():
+    analyzer = ATSAnalyzer()
+    extract = analyzer.keyword_extractor.extract_keywords
+    calls = []
+
+    async def counting(text, *args, **kwargs):
+        calls.append(text)
+        return await extract(text, *args, **kwargs)
+
+    analyzer.keyword_extractor.extract_keywords = counting
+    asyncio.run(analyzer.analyze_resume(RESUME, "Python AWS"))
+    asyncio.run(analyzer.analyze_resume(RESUME, "Docker Kubernetes"))
+    asyncio.run(analyzer.analyze_batch(["Intern", "Graduate"], ["Python AWS", "Python AWS"]))
+    assert sorted(calls) == sorted([RESUME, "Python AWS", "Docker Kubernetes", "Intern", "Graduate"])
+
+
+def test_flesch_warmed_off_the_event_loop_when_textstat_present(monkeypatch):
+    import threading
+    from src.core import ats_analyzer as analyzer_mod
+
+    threads = []
+
+    def flesch(_text):
+        threads.append(threading.get_ident())
+        return 70.0
+
+    monkeypatch.setattr(analyzer_mod, '_HAS_TEXTSTAT', True)
+    monkeypatch.setattr(analyzer_mod, 'flesch_reading_ease', flesch)
+    result = asyncio.run(ATSAnalyzer().analyze_resume(RESUME))
+    assert len(threads) == 1 and threads[0] != threading.get_ident()
+    assert result.content_analysis['readability_score'] == 70.0
+
+
+def test_batch_score_extracts_shared_jd_once():
+    analyzer = ATSAnalyzer()
+    extract_batch = analyzer.keyword_extractor.extract_keywords_batch
+    batches = []
+
+    async def recording(texts, *args, **kwargs):
+        batches.append(list(texts))
+        return await extract_batch(texts, *args, **kwargs)
+
+    analyzer.keyword_extractor.extract_keywords_batch = recording
+    resumes = [RESUME, "Intern with Python", "Graduate"]
+    scores = asyncio.run(analyzer.batch_score(resumes, ["Python AWS"] * 3))
+    assert batches == [resumes + ["Python AWS"]]
+    assert scores[0] == asyncio.run(analyzer._analyze_ats_compatibility(RESUME, "Python AWS"))  # noqa: SLF001
+
+
+def test_spacy_model_loads_lazily_once_off_the_loop(monkeypatch):
+    import threading
+    import src.core.ats_analyzer as module
+
+    loads = []
+
+    def blank(_lang):
+        loads.append(threading.get_ident())
+        return CountingNLP()
+
+    def missing(*_a, **_k):
+        raise OSError("model not installed")
+
+    monkeypatch.setattr(module, "spacy", types.SimpleNamespace(load=missing, blank=blank))
+    analyzer = ATSAnalyzer()
+    monkeypatch.setattr(analyzer, "_build_skill_matcher", lambda: (None, None))
+    assert loads == []
+
+    async def run():
+        await analyzer.analyze_resume(RESUME)
+        await analyzer.analyze_resume(RESUME + "\nPython")
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+    assert len(loads) == 1 and loads[0] != loop_thread
+    assert analyzer.nlp_mode == "blank_en"
+
+
+def test_keyword_extractor_keeps_ner_for_entity_keywords(monkeypatch):
+    import src.utils.keyword_extractor as module
+
+    loaded = []
+
+    def load(model, **kwargs):
+        loaded.append((model, kwargs))
+        return CountingNLP()
+
+    monkeypatch.setattr(module, "spacy", types.SimpleNamespace(load=load))
+    assert isinstance(module.KeywordExtractor._load_nlp(), CountingNLP)
+    assert loaded == [("en_core_web_sm", {})]
+
+
+def test_assigning_nlp_skips_the_model_load_and_resets_the_matcher(monkeypatch):
+    import src.core.ats_analyzer as module
+
+    loads = []
+
+    def load(*args, **_k):
+        loads.append(args)
+        raise OSError("model not installed")
+
+    monkeypatch.setattr(module, "spacy", types.SimpleNamespace(load=load, blank=load))
+    analyzer = ATSAnalyzer()
+    analyzer.nlp = CountingNLP()
+    assert isinstance(analyzer.nlp, CountingNLP) and loads == []
+
+    stale = object()  # matcher built against an earlier pipeline's vocab
+    analyzer._skill_matcher = stale  # noqa: SLF001
+    analyzer.nlp = None
+    assert analyzer.nlp is None and loads == []
+    assert analyzer._skill_matcher is not stale  # noqa: SLF001
@@ -1,6 +1,7 @@
 import os
 import importlib
 import json
+import types
 from pathlib import Path
 
 from src.core import config as cfg
@@ -10,11 +11,11 @@ from src.core import ats_analyzer as analyzer_mod
 def test_user_role_and_preferences_roundtrip(tmp_path, monkeypatch):
     # Point preferences file to temp path
     prefs_file = tmp_path / "user_prefs.json"
-    monkeypatch.setattr(cfg.settings, "preferences_file", str(prefs_file))
     # Clear caches
     import importlib
     import sys
     importlib.reload(cfg)
+    monkeypatch.setattr(cfg, "_PREFS_PATH", prefs_file)  # settings are frozen
 
     # Basic set/get
     cfg.set_user_preference("theme", "dark")
@@ -25,15 +26,17 @@ def test_user_role_and_preferences_roundtrip(tmp_path, monkeypatch):
     assert cfg.get_user_scoped_preference("u1", "accent") == "#ff00aa"
 
     # Roles default & add
-    assert cfg.get_user_roles("uX") == [cfg.settings.default_role]
+    assert cfg.get_user_roles("uX") == (cfg.settings.default_role,)
     cfg.add_user_role("u1", "admin")
     assert cfg.user_has_role("u1", "admin")
     assert cfg.require_role("u1", "admin") is True
+    cfg.flush_user_preferences()  # write the pending change while still pointed at tmp_path
 
 
 def test_is_production_and_cors(monkeypatch):
     monkeypatch.setenv("ENVIRONMENT", "production")
-    monkeypatch.setattr(cfg.settings, "debug", False)
+    monkeypatch.setattr(cfg, "get_settings", lambda: types.SimpleNamespace(debug=False))  # settings are frozen
+    cfg._refresh_env()  # noqa: SLF001 - the flag is resolved once per process
     assert cfg.is_production() is True
     origins = cfg.get_cors_origins()
     assert all(o.startswith("https://") for o in origins)
@@ -64,14 +67,14 @@ def test_insight_wrapper_success_path():
 def test_parse_supported_formats_variants(monkeypatch):
     # Recreate settings with string list input
     from src.core.config import Settings
-    # Directly invoke validator function (method expects (cls, v) due to design)
-    parsed_list = Settings.parse_supported_formats(Settings, '["pdf","docx","txt"]')  # type: ignore[arg-type]
+    # Directly invoke the validator (a classmethod under pydantic and the fallback alike)
+    parsed_list = Settings.parse_supported_formats('["pdf","docx","txt"]')  # type: ignore[arg-type]
     assert parsed_list == ["pdf","docx","txt"]
-    parsed_all = Settings.parse_supported_formats(Settings, 'all')  # type: ignore[arg-type]
+    parsed_all = Settings.parse_supported_formats('all')  # type: ignore[arg-type]
     assert "latex" in parsed_all and "wav" in parsed_all
-    passthrough = Settings.parse_supported_formats(Settings, ["png","jpg"])  # type: ignore[arg-type]
+    passthrough = Settings.parse_supported_formats(["png","jpg"])  # type: ignore[arg-type]
     assert passthrough == ["png","jpg"]
-    default_fallback = Settings.parse_supported_formats(Settings, 123)  # type: ignore[arg-type]
+    default_fallback = Settings.parse_supported_formats(123)  # type: ignore[arg-type]
     assert default_fallback == ["pdf","docx","txt"]
 
 
@@ -88,4 +91,19 @@ def test_config_getters_and_helpers():
 def test_is_production_false_branch(monkeypatch):
     monkeypatch.delenv("ENVIRONMENT", raising=False)
     from src.core import config as c2
+    c2._refresh_env()  # noqa: SLF001
     assert c2.is_production() is False
+    assert c2.is_production() is False  # served from the cached flag
+    assert c2.get_cors_origins() == ("*",)
+
+
+def test_settings_are_built_lazily():
+    import subprocess
+    import sys
+    probe = (
+        "import sys, src.core.config as c; "
+        "assert c.get_settings.cache_info().currsize == 0; "
+        "assert 'src.core.ats_analyzer' not in sys.modules; "
+        "assert c.settings is c.get_settings()"
+    )
+    subprocess.run([sys.executable, "-c", probe], check=True, cwd=Path(__file__).resolve().parents[1])
@@ -0,0 +1,150 @@
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+jwt = pytest.importorskip("jwt")
+
+from src.auth.jwt_handler import JWTHandler, SessionManager, _token_key
+
+
+def test_hs256_fast_path_interoperates_with_pyjwt():
+    handler = JWTHandler()
+    token = handler.create_access_token({"sub": "u1", "email": "a@b.c"})
+    decoded = jwt.decode(token, handler.secret_key, algorithms=["HS256"])
+    assert decoded["sub"] == "u1" and decoded["type"] == "access"
+
+    payload = {"sub": "u2", "exp": int(time.time()) + 60}
+    foreign = jwt.encode(payload, handler.secret_key, algorithm="HS256")
+    assert handler.verify_token(foreign) == payload
+
+
+def test_hs256_fast_path_rejects_bad_tokens():
+    handler = JWTHandler()
+    token = handler.create_access_token({"sub": "u1"})
+    with pytest.raises(jwt.InvalidTokenError):
+        handler.verify_token(token[:-2] + ("AA" if not token.endswith("AA") else "BB"))
+    with pytest.raises(jwt.InvalidTokenError):
+        handler.verify_token("not-a-token")
+    with pytest.raises(jwt.InvalidTokenError):
+        handler.verify_token("é.a.b")
+    with pytest.raises(jwt.DecodeError):
+        handler._decode("é.a.b")
+    expired = jwt.encode({"sub": "u1", "exp": 1}, handler.secret_key, algorithm="HS256")
+    with pytest.raises(jwt.ExpiredSignatureError):
+        handler.verify_token(expired)
+    future_iat = jwt.encode({"sub": "u1", "iat": int(time.time()) + 3600}, handler.secret_key, algorithm="HS256")
+    with pytest.raises(jwt.ImmatureSignatureError):
+        handler._decode(future_iat)
+    with pytest.raises(jwt.InvalidTokenError):
+        handler.verify_token(future_iat)
+    foreign_aud = jwt.encode({"sub": "u1", "aud": "other-service"}, handler.secret_key, algorithm="HS256")
+    with pytest.raises(jwt.InvalidAudienceError):
+        handler._decode(foreign_aud)
+    with pytest.raises(jwt.InvalidTokenError):
+        handler.verify_token(foreign_aud)
+    for token in (future_iat, foreign_aud):
+        with pytest.raises(jwt.InvalidTokenError):
+            jwt.decode(token, handler.secret_key, algorithms=["HS256"])
+
+
+def test_verify_token_cache_returns_copies_and_forgets_revoked():
+    handler = JWTHandler()
+    token = handler.create_access_token({"sub": "u1"})
+    first = handler.verify_token(token)
+    first["sub"] = "mutated"
+    assert handler.verify_token(token)["sub"] == "u1"
+
+    SessionManager(handler).add_to_blacklist(token)
+    assert handler._verified_cache.get(_token_key(token)) is None
+
+
+def test_blacklist_membership_uses_digests():
+    handler = JWTHandler()
+    manager = SessionManager(handler)
+    revoked = handler.create_access_token({"sub": "u1"})
+    other = handler.create_access_token({"sub": "u2"})
+    manager.add_to_blacklist(revoked)
+    assert manager.is_blacklisted(revoked)
+    assert not manager.is_blacklisted(other)
+    assert revoked not in manager.blacklisted_tokens
+
+
+def test_cleanup_expires_only_idle_sessions():
+    manager = SessionManager()
+    idle = manager.create_session("u1", "t1")
+    active = manager.create_session("u1", "t2")
+    past = datetime.utcnow() - timedelta(hours=25)
+    manager.active_sessions[idle]["last_activity"] = past
+    manager._expiry_heap[:] = sorted([(past, idle), (past, active)])
+    manager.cleanup_expired_sessions()
+    assert idle not in manager.active_sessions
+    assert active in manager.active_sessions
+    assert manager.is_blacklisted("t1") and not manager.is_blacklisted("t2")
+
+
+def test_invalidate_user_sessions_only_touches_that_user():
+    manager = SessionManager()
+    a1 = manager.create_session("a", "ta1")
+    a2 = manager.create_session("a", "ta2")
+    b1 = manager.create_session("b", "tb1")
+    manager.invalidate_user_sessions("a")
+    assert a1 not in manager.active_sessions and a2 not in manager.active_sessions
+    assert b1 in manager.active_sessions
+    assert manager.is_blacklisted("ta1") and manager.is_blacklisted("ta2")
+    assert not manager.is_blacklisted("tb1")
+    manager.invalidate_session(b1)
+    assert "b" not in manager._by_user
+
+
+def test_password_strength_single_pass_scan():
+    from src.auth.jwt_handler import PasswordManager
+
+    result = PasswordManager.check_password_strength("Ab3!efghijklmnop")
+    assert all(result["requirements"].values())
+    assert result["strength"] == "Very Strong"
+    weak = PasswordManager.check_password_strength("ÉCOLE")
+    assert weak["requirements"]["uppercase"] and not weak["requirements"]["lowercase"]
+    assert PasswordManager.audit_passwords(["Ab3!efghijklmnop", "ÉCOLE"]) == [result, weak]
+
+
+def test_expiry_helpers():
+    handler = JWTHandler()
+    token = handler.create_access_token({"sub": "u1"})
+    assert not handler.is_token_expired(token)
+    assert handler.get_token_expiry(token) > datetime.now()
+    expired = jwt.encode({"sub": "u1", "exp": 1}, handler.secret_key, algorithm="HS256")
+    assert handler.is_token_expired(expired)
+    assert handler.is_token_expired("garbage") and handler.get_token_expiry("garbage") is None
+
+
+def test_refresh_access_token_issues_access_token():
+    handler = JWTHandler()
+    refresh = handler.create_refresh_token({"sub": "u1", "email": "a@b.c"})
+    claims = handler.verify_token(handler.refresh_access_token(refresh))
+    assert (claims["sub"], claims["email"], claims["type"]) == ("u1", "a@b.c", "access")
+    with pytest.raises(jwt.InvalidTokenError):
+        handler.refresh_access_token(handler.create_access_token({"sub": "u1"}))
+
+
+def test_api_token_roundtrip():
+    handler = JWTHandler()
+    claims = handler.verify_api_token(handler.create_api_token("u1", "key-1"))
+    assert (claims["sub"], claims["api_key_id"], claims["type"]) == ("u1", "key-1", "api")
+    assert claims["exp"] - claims["iat"] == 365 * 86400
+
+
+def test_blacklist_negative_lookups_and_pruning():
+    handler = JWTHandler()
+    manager = SessionManager(handler)
+    revoked = handler.create_access_token({"sub": "u1"})
+    manager.add_to_blacklist(revoked)
+    manager.add_to_blacklist("opaque-token")  # no readable exp
+    assert not any(manager.is_blacklisted(f"other-{i}") for i in range(1000))
+
+    exp = manager.blacklisted_tokens[_token_key(revoked)]
+    manager._prune_blacklist(exp)
+    assert not manager.is_blacklisted(revoked)
+    assert manager.is_blacklisted("opaque-token")
+    manager._prune_blacklist(time.time() + 366 * 86400)
+    assert manager.blacklisted_tokens == {}
@@ -0,0 +1,94 @@
+import asyncio
+import importlib
+import io
+import sys
+import types
+
+import pytest
+
+# Imports of the resume processor that may be unavailable here (optional extraction
+# libraries, or a module that does not import); section parsing touches none of them.
+_OPTIONAL = {
+    "PyPDF2": {},
+    "pdfplumber": {},
+    "docx": {"Document": None},
+    "minio": {"Minio": None},
+    "src.utils.text_cleaner": {"TextCleaner": None},
+    "src.utils.file_validator": {"FileValidator": None},
+}
+
+
+@pytest.fixture
+def rp(monkeypatch):
+    for name, attrs in _OPTIONAL.items():
+        try:
+            importlib.import_module(name)
+        except Exception:
+            monkeypatch.setitem(sys.modules, name, types.SimpleNamespace(**attrs))
+    monkeypatch.delitem(sys.modules, "src.core.resume_processor", raising=False)
+    return importlib.import_module("src.core.resume_processor")
+
+
+def _sections(rp, text):
+    processor = object.__new__(rp.ResumeProcessor)
+    return asyncio.run(processor._extract_sections(text))
+
+
+def test_sections_run_from_header_to_next_header(rp):
+    text = (
+        "Jane Roe\n"
+        "Summary: Backend engineer, experienced in APIs\n"
+        "Experience Acme Corp 2019-2024\n"
+        "Built billing services\n"
+        "Education\n"
+        "BSc Computer Science\n"
+        "Skills: Python, Go"
+    )
+    assert _sections(rp, text) == {
+        "summary": "Backend engineer, experienced in APIs",
+        "experience": "Acme Corp 2019-2024\nBuilt billing services",
+        "education": "BSc Computer Science",
+        "skills": "Python, Go",
+    }
+
+
+def test_text_under_repeated_or_synonym_headers_is_kept(rp):
+    text = "Experience\nAcme\nTechnologies: Python\nEmployment type: contract\nSkills\nSQL"
+    assert _sections(rp, text) == {
+        "experience": "Acme\ntype: contract",
+        "skills": "Python\nSQL",
+    }
+
+
+def test_non_ascii_lookalike_headers_are_not_sections(rp):
+    # Dotless 'ı' survives NFKD and case-folds to 'i' under Unicode matching
+    text = "SKıLLS Python\nEducatıon BSc\nCertıfıcatıons: AWS\nExperience\nAcme"
+    assert _sections(rp, text) == {"experience": "Acme"}
+
+
+def test_empty_sections_and_headerless_text_are_skipped(rp):
+    assert _sections(rp, "Jane Roe\nBackend engineer") == {}
+    assert _sections(rp, "Projects\nCertifications: AWS SAA") == {"certifications": "AWS SAA"}
+
+
+def test_word_extraction_keeps_blank_paragraphs(rp, monkeypatch):
+    cell = types.SimpleNamespace
+    doc = types.SimpleNamespace(
+        paragraphs=[cell(text="Jane Roe"), cell(text=""), cell(text="Experience"), cell(text="Acme")],
+        tables=[types.SimpleNamespace(rows=[types.SimpleNamespace(cells=[cell(text="Python"), cell(text="SQL")])])],
+    )
+    monkeypatch.setattr(rp, "Document", lambda _f: doc)
+    processor = object.__new__(rp.ResumeProcessor)
+    text, method, pages = asyncio.run(processor._extract_from_word(io.BytesIO()))
+    assert (text, method, pages) == ("Jane Roe\n\nExperience\nAcme\nPython SQL", "python-docx", 1)
+
+
+def test_pdf_extraction_skips_pages_without_text(rp, monkeypatch):
+    pages = [types.SimpleNamespace(extract_text=lambda t=t: t) for t in ("One", None, "Two")]
+
+    def broken(_f):
+        raise RuntimeError("no parser")
+
+    monkeypatch.setattr(rp, "pdfplumber", types.SimpleNamespace(open=broken))
+    monkeypatch.setattr(rp, "PyPDF2", types.SimpleNamespace(PdfReader=lambda _f: types.SimpleNamespace(pages=pages)))
+    assert rp.ResumeProcessor._extract_pdf_text(io.BytesIO()) == ("One\nTwo", "PyPDF2", 3)
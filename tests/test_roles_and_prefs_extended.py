@@ -1,5 +1,8 @@
+import pytest
+
 from src.core.config import (
     add_user_role,
+    add_user_roles,
     get_user_roles,
     user_has_role,
     set_user_scoped_preference,
@@ -7,12 +10,24 @@ from src.core.config import (
 )
 
 
-def test_role_fallback_default():
+@pytest.fixture
+def prefs_store(tmp_path, monkeypatch):
+    # Keep the tracked data/user_prefs.json out of the tests: a private file and a fresh cache,
+    # flushed before the patches are undone so no pending write lands in the real store.
+    from src.core import config as cfg
+    cfg.flush_user_preferences()
+    monkeypatch.setattr(cfg, '_PREFS_PATH', tmp_path / 'prefs.json')
+    monkeypatch.setattr(cfg, '_PREF_CACHE', None)
+    yield tmp_path / 'prefs.json'
+    cfg.flush_user_preferences()
+
+
+def test_role_fallback_default(prefs_store):
     roles = get_user_roles('nonexistent-user-xyz')
-    assert roles == ['user']
+    assert roles == ('user',)
 
 
-def test_add_multiple_roles():
+def test_add_multiple_roles(prefs_store):
     uid = 'multi-role-user'
     add_user_role(uid, 'admin')
     add_user_role(uid, 'auditor')
@@ -21,9 +36,34 @@ def test_add_multiple_roles():
     assert 'admin' in roles and 'auditor' in roles
 
 
-def test_user_scoped_preference_isolated():
+def test_user_scoped_preference_isolated(prefs_store):
     u1, u2 = 'userA', 'userB'
     set_user_scoped_preference(u1, 'color', 'red')
     set_user_scoped_preference(u2, 'color', 'blue')
     assert get_user_scoped_preference(u1, 'color') == 'red'
     assert get_user_scoped_preference(u2, 'color') == 'blue'
+
+
+def test_add_user_roles_saves_once(tmp_path, monkeypatch):
+    from src.core import config as cfg
+    monkeypatch.setattr(cfg, '_PREFS_PATH', tmp_path / 'prefs.json')
+    monkeypatch.setattr(cfg, '_PREF_CACHE', {})
+    saves = []
+    monkeypatch.setattr(cfg, 'save_user_preferences', lambda prefs: saves.append(prefs))
+    uid = 'bulk-role-user'
+    add_user_roles(uid, ['user', 'reviewer', 'admin', 'reviewer'])
+    assert get_user_roles(uid) == ('user', 'reviewer', 'admin')
+    assert len(saves) == 1
+    add_user_roles(uid, ['admin'])
+    assert len(saves) == 1  # nothing new to grant
+
+
+def test_roles_are_normalized_once_and_returned_as_stored(prefs_store, monkeypatch):
+    from src.core import config as cfg
+    monkeypatch.setattr(cfg, '_PREF_CACHE', {'users': {'legacy': {'roles': ['admin', 7]}}})
+    roles = get_user_roles('legacy')
+    assert roles == ('admin', '7')
+    assert get_user_roles('legacy') is roles
+    set_user_scoped_preference('scoped', 'roles', 'auditor')
+    assert get_user_roles('scoped') == ('auditor',)
+    assert user_has_role('scoped', 'auditor') and not user_has_role('scoped', 'admin')
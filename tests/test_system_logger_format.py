@@ -153,3 +153,27 @@ def test_init_idempotent_does_not_duplicate(capsys):
     # Each call should produce exactly one line
     assert out1.count("ATS-SYSTEM-LOG") == 1
     assert out2.count("ATS-SYSTEM-LOG") == 1
+
+
+def test_function_log_filtered_level_skips_event_but_reports_errors(capsys, monkeypatch):
+    _reset_logger()
+    init_system_logger(level=logging.INFO, enable_colors=False)
+    monkeypatch.setattr(sl.inspect, "signature", lambda _fn: pytest.fail("bound a filtered call"))
+
+    @log_function("DEBUG", "QUIET")
+    def quiet(x: int) -> int:
+        return x * 2
+
+    @log_function("DEBUG")
+    async def loud(_: int) -> None:
+        raise ValueError("nope")
+
+    assert quiet(4) == 8
+    assert capsys.readouterr().out == ""
+
+    monkeypatch.undo()
+    with pytest.raises(ValueError):
+        asyncio.run(loud(1))
+    parts = _split_log(capsys.readouterr().out)
+    assert parts[1] == "ERROR" and parts[2] == "loud"
+    assert "_=1(int)" in parts[3] and parts[11] == "nope" and parts[12] == "✖"
@@ -11,16 +11,24 @@ from src.core.config import (
 import os
 
 
+def _use_private_store(tmp_path, monkeypatch):
+    from src.core import config as cfg
+
+    cfg.flush_user_preferences()
+    monkeypatch.setattr(cfg, '_PREFS_PATH', tmp_path / 'prefs.json')
+    monkeypatch.setattr(cfg, '_PREF_CACHE', None)
+    return cfg
+
+
 def test_global_preference_roundtrip(tmp_path, monkeypatch):
-    # Redirect preferences file
-    prefs_path = tmp_path / 'prefs.json'
-    monkeypatch.setenv('PREFS_FILE_OVERRIDE', str(prefs_path))
-    # Direct manipulate underlying module globals
+    cfg = _use_private_store(tmp_path, monkeypatch)
     set_user_preference('dark_mode', True)
     assert get_user_preference('dark_mode') is True
+    cfg.flush_user_preferences()
 
 
 def test_user_scoped_preferences_and_roles(tmp_path, monkeypatch):
+    cfg = _use_private_store(tmp_path, monkeypatch)
     user_id = 'u123'
     set_user_scoped_preference(user_id, 'note', 'hello')
     assert get_user_scoped_preference(user_id, 'note') == 'hello'
@@ -28,3 +36,113 @@ def test_user_scoped_preferences_and_roles(tmp_path, monkeypatch):
     roles = get_user_roles(user_id)
     assert 'admin' in roles
     assert user_has_role(user_id, 'admin')
+    cfg.flush_user_preferences()
+
+
+def test_preference_writes_are_coalesced_until_flush(tmp_path, monkeypatch):
+    import json
+    from src.core import config as cfg
+
+    cfg.flush_user_preferences()  # settle anything earlier tests left pending
+    prefs_path = tmp_path / 'prefs.json'
+    monkeypatch.setattr(cfg, '_PREFS_PATH', prefs_path)
+    monkeypatch.setattr(cfg, '_PREF_CACHE', {})
+    monkeypatch.setattr(cfg, '_PREF_FLUSH_DELAY', 60)
+    set_user_preference('theme', 'dark')
+    set_user_scoped_preference('u9', 'note', 'hi')
+    assert not prefs_path.exists()
+    cfg.flush_user_preferences()
+    saved = json.loads(prefs_path.read_text(encoding='utf-8'))
+    assert saved['theme'] == 'dark' and saved['users']['u9'] == {'note': 'hi'}
+    assert cfg._PREF_TIMER is None and not cfg._PREF_DIRTY
+
+
+def test_reading_scoped_preferences_does_not_schedule_a_write(tmp_path, monkeypatch):
+    from src.core import config as cfg
+
+    cfg.flush_user_preferences()
+    monkeypatch.setattr(cfg, '_PREFS_PATH', tmp_path / 'prefs.json')
+    monkeypatch.setattr(cfg, '_PREF_CACHE', {})
+    assert get_user_scoped_preference('nobody', 'note', 'x') == 'x'
+    assert get_user_roles('nobody') == ('user',)
+    assert not cfg._PREF_DIRTY and cfg._PREF_TIMER is None
+
+
+def test_missing_preference_file_is_checked_once(tmp_path, monkeypatch):
+    from src.core import config as cfg
+
+    class CountingPath(type(tmp_path)):
+        checks = 0
+
+        def exists(self, **kwargs):
+            CountingPath.checks += 1
+            return super().exists(**kwargs)
+
+    monkeypatch.setattr(cfg, '_PREFS_PATH', CountingPath(tmp_path / 'absent.json'))
+    monkeypatch.setattr(cfg, '_PREF_CACHE', None)
+    assert load_user_preferences() == {}
+    assert get_user_preference('theme', 'light') == 'light'
+    assert CountingPath.checks == 1
+
+
+def test_forked_worker_schedules_its_own_flush(tmp_path, monkeypatch):
+    import pytest
+    from src.core import config as cfg
+
+    if not hasattr(os, 'fork'):
+        pytest.skip('fork not available')
+    cfg.flush_user_preferences()
+    monkeypatch.setattr(cfg, '_PREFS_PATH', tmp_path / 'prefs.json')
+    monkeypatch.setattr(cfg, '_PREF_CACHE', {})
+    monkeypatch.setattr(cfg, '_PREF_FLUSH_DELAY', 60)
+    set_user_preference('parent', True)  # parent now holds a pending timer thread
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child
+        if cfg._PREF_DIRTY:  # the parent's pending write is not the child's to repeat
+            os._exit(2)
+        set_user_preference('child', True)
+        ok = cfg._PREF_TIMER is not None and cfg._PREF_TIMER.is_alive()
+        os._exit(0 if ok else 1)
+    _, status = os.waitpid(pid, 0)
+    cfg.flush_user_preferences()
+    assert os.waitstatus_to_exitcode(status) == 0
+
+
+def test_unchanged_preferences_are_not_rewritten(tmp_path, monkeypatch):
+    from src.core import config as cfg
+
+    cfg.flush_user_preferences()
+    monkeypatch.setattr(cfg, '_PREFS_PATH', tmp_path / 'prefs.json')
+    monkeypatch.setattr(cfg, '_PREF_CACHE', {})
+    set_user_preference('theme', 'dark')
+    set_user_scoped_preference('u7', 'accent', 'red')
+    cfg.flush_user_preferences()
+    set_user_preference('theme', 'dark')
+    set_user_scoped_preference('u7', 'accent', 'red')
+    assert not cfg._PREF_DIRTY and cfg._PREF_TIMER is None
+    set_user_scoped_preference('u7', 'accent', 'blue')
+    assert cfg._PREF_DIRTY
+    cfg.flush_user_preferences()
+
+
+def test_preference_mutated_in_place_is_still_saved(tmp_path, monkeypatch):
+    import json
+    from src.core import config as cfg
+
+    cfg.flush_user_preferences()
+    prefs_path = tmp_path / 'prefs.json'
+    monkeypatch.setattr(cfg, '_PREFS_PATH', prefs_path)
+    monkeypatch.setattr(cfg, '_PREF_CACHE', {})
+    set_user_preference('pinned', ['a'])
+    set_user_scoped_preference('u7', 'tags', {'x': 1})
+    cfg.flush_user_preferences()
+    pinned = get_user_preference('pinned')
+    pinned.append('b')
+    set_user_preference('pinned', pinned)
+    tags = get_user_scoped_preference('u7', 'tags')
+    tags['y'] = 2
+    set_user_scoped_preference('u7', 'tags', tags)
+    assert cfg._PREF_DIRTY
+    cfg.flush_user_preferences()
+    saved = json.loads(prefs_path.read_text(encoding='utf-8'))
+    assert saved['pinned'] == ['a', 'b'] and saved['users']['u7']['tags'] == {'x': 1, 'y': 2}
@@ -58,7 +58,7 @@ def test_low_score_recommendations():
 def test_format_score_empty_input_branch():
     analyzer = original_ats_analyzer.ATSAnalyzer()
     # Directly call internal method to cover empty non_empty_lines branch
-    score = analyzer._calculate_format_score("")  # noqa: SLF001
+    score = analyzer._score_all(original_ats_analyzer._Ctx.build(""))[0]  # noqa: SLF001
     # Should return minimal baseline (>= 0.1 due to neutral contribution path)
     assert score >= 0.1
 
@@ -70,5 +70,5 @@ def test_readability_score_branches(monkeypatch):
     expected = {70:1.0, 50:0.8, 85:0.8, 30:0.6, 10:0.4}
     for val in target_values:
         monkeypatch.setattr(original_ats_analyzer, "flesch_reading_ease", lambda _t, v=val: v)
-        r = analyzer._calculate_readability_score("Dummy text.")  # noqa: SLF001
+        r = analyzer._score_all(original_ats_analyzer._Ctx.build("Dummy text."))[1]  # noqa: SLF001
         assert r == expected[val]